@@ -10,8 +10,11 @@
 
 from __future__ import annotations
 
+import hashlib
 import os
+import shutil
 import subprocess
+import tempfile
 import warnings
 from importlib import metadata
 from pathlib import Path
@@ -22,27 +25,47 @@ from pybtex.style.formatting.unsrt import Style as UnsrtStyle
 from pybtex.style.template import field, href
 
 if TYPE_CHECKING:
+    from typing import Any
+
     from pybtex.database import Entry
     from pybtex.richtext import HRef
+    from sphinx.application import Sphinx
 
 ROOT = Path(__file__).parent.parent.resolve()
 
 
-try:
-    from mqt.debugger import __version__ as version
-except ModuleNotFoundError:
+def _resolve_version() -> str:
+    """Determine the package version, preferring the cheapest available source.
+
+    The installed package metadata is consulted first, and `setuptools_scm` (which needs to run `git`) is only used
+    if the package is not installed at all.
+
+    Returns:
+        The version of the package.
+    """
+    try:
+        return metadata.version("mqt.debugger")
+    except metadata.PackageNotFoundError:
+        pass
     try:
-        version = metadata.version("mqt.debugger")
+        from mqt.debugger import __version__
     except ModuleNotFoundError:
-        msg = (
-            "Package should be installed to produce documentation! "
-            "Assuming a modern git archive was used for version discovery."
-        )
-        warnings.warn(msg, stacklevel=1)
+        pass
+    else:
+        return __version__
+
+    msg = (
+        "Package should be installed to produce documentation! "
+        "Assuming a modern git archive was used for version discovery."
+    )
+    warnings.warn(msg, stacklevel=1)
+
+    from setuptools_scm import get_version
 
-        from setuptools_scm import get_version
+    return get_version(root=str(ROOT), fallback_root=ROOT)
 
-        version = get_version(root=str(ROOT), fallback_root=ROOT)
+
+version = _resolve_version()
 
 # Filter git details from version
 release = version.split("+")[0]
@@ -133,8 +156,6 @@ class CDAStyle(UnsrtStyle):
         return href()[url, "[PDF]"]
 
 
-pybtex.plugin.register_plugin("pybtex.style.formatting", "cda_style", CDAStyle)
-
 bibtex_bibfiles = ["lit_header.bib", "refs.bib"]
 bibtex_default_style = "cda_style"
 
@@ -154,13 +175,64 @@ napoleon_numpy_docstring = False
 breathe_projects = {"mqt-debugger": "doxygen/xml"}
 breathe_default_project = "mqt-debugger"
 
+DOXYGEN_INPUTS = (ROOT / "include", ROOT / "src")
+DOXYGEN_SUFFIXES = {".c", ".cc", ".cxx", ".cpp", ".c++", ".hh", ".hxx", ".hpp", ".h++", ".h", ".py", ".pyi"}
+
+
+def _doxygen_inputs_hash() -> str:
+    """Hash the Doxyfile and all sources that doxygen reads.
+
+    Returns:
+        The hex digest over the names and contents of all inputs.
+    """
+    digest = hashlib.sha256()
+    files = [ROOT / "docs" / "Doxyfile"]
+    for directory in DOXYGEN_INPUTS:
+        files.extend(sorted(p for p in directory.rglob("*") if p.suffix in DOXYGEN_SUFFIXES and p.is_file()))
+    for file in files:
+        digest.update(str(file.relative_to(ROOT)).encode())
+        digest.update(file.read_bytes())
+    return digest.hexdigest()
+
+
+def _write_if_changed(path: Path, data: bytes) -> None:
+    """Write `data` to `path` unless the file already has exactly this content, so its mtime stays stable."""
+    if path.exists() and path.read_bytes() == data:
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+
+
+def _generate_cpp_api_docs() -> None:
+    """Run doxygen and breathe-apidoc, skipping both if none of their inputs changed since the last run."""
+    doxygen_dir = ROOT / "docs" / "doxygen"
+    marker = doxygen_dir / ".inputs.sha"
+    inputs_hash = _doxygen_inputs_hash()
+    if marker.exists() and marker.read_text() == inputs_hash:
+        return
+
+    if shutil.which("doxygen") is None or shutil.which("breathe-apidoc") is None:
+        warnings.warn("doxygen and breathe-apidoc are required to build the C++ API docs.", stacklevel=1)
+        return
+
+    doxygen_dir.mkdir(parents=True, exist_ok=True)
+    if subprocess.call(["doxygen", "Doxyfile"], cwd=ROOT / "docs") != 0:  # noqa: S607
+        return
+
+    api_dir = ROOT / "docs" / "api" / "cpp"
+    with tempfile.TemporaryDirectory() as tmp:
+        breathe_apidoc = ["breathe-apidoc", "-o", tmp, "-m", "-f", "-g", "namespace", str(doxygen_dir / "xml")]
+        if subprocess.call(breathe_apidoc) != 0:  # noqa: S603
+            return
+        for generated in Path(tmp).rglob("*.rst"):
+            _write_if_changed(api_dir / generated.relative_to(tmp), generated.read_bytes())
+
+    marker.write_text(inputs_hash)
+
+
 read_the_docs_build = os.environ.get("READTHEDOCS", None) == "True"
 if read_the_docs_build:
-    subprocess.call("mkdir -p _build/doxygen && doxygen", shell=True)  # noqa: S602, S607
-    subprocess.call(  # noqa: S602
-        "mkdir -p api/cpp && breathe-apidoc -o api/cpp -m -f -g namespace _build/doxygen/xml/",  # noqa: S607
-        shell=True,
-    )
+    _generate_cpp_api_docs()
 
 # -- Options for HTML output -------------------------------------------------
 html_theme = "furo"
@@ -173,3 +245,19 @@ html_theme_options = {
     "source_directory": "docs/",
     "navigation_with_keys": True,
 }
+
+
+def setup(_app: Sphinx) -> dict[str, Any]:
+    """Register the custom bibliography style.
+
+    Whether Sphinx reads and writes in parallel is decided by the metadata of the loaded extensions, all of which
+    declare themselves parallel-safe. The metadata returned here documents that this configuration is as well.
+
+    Returns:
+        The metadata of this configuration.
+    """
+    try:
+        pybtex.plugin.find_plugin("pybtex.style.formatting", "cda_style")
+    except pybtex.plugin.PluginNotFound:
+        pybtex.plugin.register_plugin("pybtex.style.formatting", "cda_style", CDAStyle)
+    return {"version": version, "parallel_read_safe": True, "parallel_write_safe": True}
@@ -173,6 +173,7 @@ def docs(session: nox.Session) -> None:
     shared_args = [
         "-n",  # nitpicky mode
         "-T",  # full tracebacks
+        "-j=auto",  # parallel read and write phases
         f"-b={args.builder}",
         "docs",
         f"docs/_build/{args.builder}",
@@ -10,7 +10,9 @@
 
 from __future__ import annotations
 
-from . import check, dap
+import importlib
+from typing import TYPE_CHECKING
+
 from ._version import version as __version__
 from .pydebugger import (
     CompilationSettings,
@@ -27,6 +29,13 @@ from .pydebugger import (
     destroy_ddsim_simulation_state,
 )
 
+if TYPE_CHECKING:
+    from types import ModuleType
+
+    from . import check, dap
+
+_LAZY_SUBMODULES = ("check", "dap")
+
 __all__ = [
     "CompilationSettings",
     "Complex",
@@ -41,7 +50,26 @@ __all__ = [
     "__version__",
     "check",
     "create_ddsim_simulation_state",
-    "create_ddsim_simulation_state",
     "dap",
     "destroy_ddsim_simulation_state",
 ]
+
+
+def __getattr__(name: str) -> ModuleType:
+    """Import the `check` and `dap` subpackages on first access.
+
+    Args:
+        name (str): The name of the requested attribute.
+
+    Returns:
+        ModuleType: The requested subpackage.
+
+    Raises:
+        AttributeError: If `name` is not a lazily loaded subpackage.
+    """
+    if name in _LAZY_SUBMODULES:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
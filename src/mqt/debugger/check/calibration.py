@@ -10,7 +10,9 @@
 
 from __future__ import annotations
 
+from collections import Counter
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 missing_optionals: list[str] = []
 
@@ -55,35 +57,52 @@ class Calibration:
         fidelity_1q = 1 - self.error_rate_1q
         fidelity_2q = 1 - self.error_rate_2q
 
+        gate_counts, total_time = _summarize_circuit(code)
         gate_fidelity = 1.0
-        qc = QuantumCircuit.from_qasm_str(code)
-        for instruction in qc.data:
-            gate_type = instruction.name
+        for gate_type, num_qubits, count in gate_counts:
             if gate_type in self.specific_gate_errors:
-                gate_fidelity *= 1 - self.specific_gate_errors[gate_type]
+                gate_fidelity *= (1 - self.specific_gate_errors[gate_type]) ** count
                 continue
             if gate_type == "barrier":
                 continue
-            if len(instruction.qubits) == 1:
+            if num_qubits == 1:
                 if gate_type == "measure":
-                    gate_fidelity *= fidelity_measurement
+                    gate_fidelity *= fidelity_measurement**count
                 else:
-                    gate_fidelity *= fidelity_1q
+                    gate_fidelity *= fidelity_1q**count
             else:
-                gate_fidelity *= fidelity_2q
+                gate_fidelity *= fidelity_2q**count
 
-        qubit_times = dict.fromkeys(qc.qubits, 0)
-
-        for instruction in qc.data:
-            max_time = max(qubit_times[qubit] for qubit in instruction.qubits)
-            for qubit in instruction.qubits:
-                qubit_times[qubit] = max_time + 1
-        qubit_fidelity = 1
-        for qubit in qubit_times:
-            qubit_fidelity *= np.exp(-qubit_times[qubit] * self.t)
-        return gate_fidelity * qubit_fidelity
+        qubit_fidelity = np.exp(-total_time * self.t)
+        return float(gate_fidelity * qubit_fidelity)
 
     @classmethod
     def example(cls) -> Calibration:
         """Get an example calibration."""
         return cls(0.01, 0.01, 0.01)
+
+
+@lru_cache(maxsize=128)
+def _summarize_circuit(code: str) -> tuple[tuple[tuple[str, int, int], ...], int]:
+    """Parse a program and summarize the parts of it that determine its success probability.
+
+    The result only depends on the program, so it is shared by all calibrations.
+
+    Args:
+        code (str): The program to summarize.
+
+    Returns:
+        tuple[tuple[tuple[str, int, int], ...], int]: The number of instructions per gate type and qubit count,
+        and the sum of the depths of all qubits.
+    """
+    qc = QuantumCircuit.from_qasm_str(code)
+    gate_counts: Counter[tuple[str, int]] = Counter()
+    qubit_times = dict.fromkeys(qc.qubits, 0)
+    for instruction in qc.data:
+        qubits = instruction.qubits
+        gate_counts[instruction.name, len(qubits)] += 1
+        time = max(qubit_times[qubit] for qubit in qubits) + 1
+        for qubit in qubits:
+            qubit_times[qubit] = time
+    summary = tuple((name, num_qubits, count) for (name, num_qubits), count in gate_counts.items())
+    return summary, sum(qubit_times.values())
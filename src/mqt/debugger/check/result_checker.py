@@ -10,17 +10,22 @@
 
 from __future__ import annotations
 
-import json
-import operator
+import heapq
+import math
+import re
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 missing_optionals: list[str] = []
 try:
-    from scipy.stats import chi2  # type: ignore[import-untyped]
+    from scipy.special import chdtrc  # type: ignore[import-untyped]
 except ImportError:
     missing_optionals.append("scipy")
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads  # type: ignore[assignment]
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -32,6 +37,9 @@ COLOR_GREEN = "\033[92m"
 COLOR_RED = "\033[91m"
 COLOR_RESET = "\033[0m"
 
+# One line of the assertion header of a compiled program: the measured variables and the assertion that follows.
+_ASSERTION_HEADER = re.compile(r"// ASSERT:[^\n(]*\(([^\n()]*)\)[^\n{]*(\{[^\r\n{]*)[^\n]*\n?")
+
 
 @dataclass
 class Result:
@@ -51,27 +59,27 @@ class Result:
         Returns:
             Result: The result of the quantum program.
         """
-        if isinstance(path, Path):
-            with path.open("r") as f:
-                data = json.load(f)
-        else:
-            data = json.load(path)
-        filled_distribution = {key: [0 for _ in range(2 ** len(key))] for key in distributions}
+        data = json_loads(path.read_bytes() if isinstance(path, Path) else path.read())
+        # Repeated distributions share a single histogram.
+        unique_distributions = list(dict.fromkeys(distributions))
+        counts = [[0 for _ in range(2 ** len(key))] for key in unique_distributions]
+        # Each variable contributes to the first distribution that contains it, at its first position there.
+        bits: dict[str, tuple[int, int]] = {}
+        for position, distribution in enumerate(unique_distributions):
+            for index, name in enumerate(distribution):
+                bits.setdefault(name, (position, 1 << index))
         for entry in data:
-            indices = dict.fromkeys(distributions, 0)
-            for key in entry:
-                val = int(entry[key])
-                if val == 0:
+            indices = [0] * len(unique_distributions)
+            for key, val in entry.items():
+                if int(val) == 0:
                     continue
-                parent_distribution_list = [x for x in distributions if key in x]
-                if not parent_distribution_list:
+                bit = bits.get(key)
+                if bit is None:
                     continue
-                parent_distribution = parent_distribution_list[0]
-                index = parent_distribution.index(key)
-                indices[parent_distribution] += 2**index
-            for key, value in indices.items():
-                filled_distribution[key][value] += 1
-        return Result(len(data), filled_distribution)
+                indices[bit[0]] += bit[1]
+            for distribution_counts, value in zip(counts, indices):
+                distribution_counts[value] += 1
+        return Result(len(data), dict(zip(unique_distributions, counts)))
 
 
 def distribution_equal_under_noise(
@@ -152,26 +160,18 @@ def merge_bins(observed: list[float], expected: list[float], min_size: int = -1)
     """
     if min_size == -1:
         min_size = int(max(5, max(observed) // len(observed) // 2))
-    expected_indexed = list(enumerate(expected))
-    expected_indexed.sort(key=operator.itemgetter(1))
-    observed = [observed[e[0]] for e in expected_indexed]
-    expected = [e[1] for e in expected_indexed]
-
-    while expected[0] < min_size and len(expected) > 2:
-        new_expected = expected[0] + expected[1]
-        new_observed = observed[0] + observed[1]
-        del expected[0]
-        del observed[0]
-        del expected[0]
-        del observed[0]
-        for i in range(len(expected)):
-            if new_expected < expected[i]:
-                expected.insert(i, new_expected)
-                observed.insert(i, new_observed)
-                break
-        else:
-            expected.append(new_expected)
-            observed.append(new_observed)
+    # Bins are ordered by expected value. Ties keep the input order, and a merged bin goes after existing equal bins.
+    heap = [(e, i, o) for i, (e, o) in enumerate(zip(expected, observed))]
+    heapq.heapify(heap)
+    order = len(heap)
+    while heap[0][0] < min_size and len(heap) > 2:
+        e_1, _, o_1 = heapq.heappop(heap)
+        e_2, _, o_2 = heapq.heappop(heap)
+        heapq.heappush(heap, (e_1 + e_2, order, o_1 + o_2))
+        order += 1
+    heap.sort()
+    observed = [o for _, _, o in heap]
+    expected = [e for e, _, _ in heap]
     return observed, expected
 
 
@@ -237,7 +237,10 @@ def check_power_divergence(
         val += o * (((o / e) ** power) - 1)
     val *= 2 / (power * (power + 1))
 
-    return val, chi2.sf(val, len(observed) - 1)
+    # chdtrc is the chi-squared survival function without the overhead of scipy.stats. Like chi2.sf, the result
+    # is 1 below the support and undefined without degrees of freedom.
+    degrees_of_freedom = len(observed) - 1
+    return val, chdtrc(degrees_of_freedom, max(val, 0.0)) if degrees_of_freedom > 0 else math.nan
 
 
 def check_assertion_superposition(
@@ -352,15 +355,14 @@ def check_result(
     Returns:
         bool: True if all assertions are satisfied, False otherwise.
     """
-    lines = compiled_code.splitlines()
     distributions: list[tuple[str, ...]] = []
     assertions: dict[tuple[str, ...], str] = {}
-    for line in lines:
-        if not line.startswith("// ASSERT:"):
-            break
-        var_list = tuple(line.split("(")[1].split(")")[0].split(","))
+    position = 0
+    while (header := _ASSERTION_HEADER.match(compiled_code, position)) is not None:
+        var_list = tuple(header.group(1).split(","))
         distributions.append(var_list)
-        assertions[var_list] = f"{{{line.split('{')[1]}"
+        assertions[var_list] = header.group(2)
+        position = header.end()
     result = Result.load(result_path, distributions)
 
     expected_success_probability = calibration.get_expected_success_probability(compiled_code)
@@ -11,6 +11,9 @@
 from __future__ import annotations
 
 import random
+import re
+from bisect import bisect_right
+from itertools import accumulate
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -21,6 +24,8 @@ from . import result_checker
 if TYPE_CHECKING:
     from .calibration import Calibration
 
+_ASSERTION_LINE = re.compile(r"^// ASSERT: ([^\r\n]*)", re.MULTILINE)
+
 
 def extract_assertions_from_code(code: str) -> list[str]:
     """Extract the assertions from the given code.
@@ -31,7 +36,7 @@ def extract_assertions_from_code(code: str) -> list[str]:
     Returns:
         list[str]: The extracted assertions.
     """
-    return [x[11:] for x in code.splitlines() if x.startswith("// ASSERT: ")]
+    return _ASSERTION_LINE.findall(code)
 
 
 def start_compilation(code: Path, output_dir: Path) -> None:
@@ -73,14 +78,13 @@ def sample_distribution(expected_distribution_under_noise: list[float], num_samp
     Returns:
         list[int]: The sampled distribution.
     """
-    samples: list[int] = [0 for _ in expected_distribution_under_noise]
+    # One extra bin catches values past the total likelihood, which are not counted.
+    samples: list[int] = [0 for _ in range(len(expected_distribution_under_noise) + 1)]
+    cumulative = list(accumulate(expected_distribution_under_noise))
+    rnd = random.random  # noqa: S311
     for _ in range(num_samples):
-        rnd = random.random()  # noqa: S311
-        for i, likelihood in enumerate(expected_distribution_under_noise):
-            if rnd < likelihood:
-                samples[i] += 1
-                break
-            rnd -= likelihood
+        samples[bisect_right(cumulative, rnd())] += 1
+    del samples[-1]
     return samples
 
 
@@ -159,11 +163,15 @@ def estimate_required_shots(
     """
     expected_success_probability = calibration.get_expected_success_probability(program)
     assertions = extract_assertions_from_code(program)
-    required_shots = [
-        estimate_required_shots_for_assertion(a, expected_success_probability, p_value, num_trials, accuracy)
-        for a in assertions
-    ]
-    return max(required_shots)
+    required_shots: dict[tuple[int, str], int] = {}
+    for a in assertions:
+        # Assertions that only differ in the names of their variables share the same estimate.
+        key = (a.split("(")[1].split(")")[0].count(","), a[a.index("{") :])
+        if key not in required_shots:
+            required_shots[key] = estimate_required_shots_for_assertion(
+                a, expected_success_probability, p_value, num_trials, accuracy
+            )
+    return max(required_shots.values())
 
 
 def estimate_required_shots_from_path(
@@ -13,14 +13,45 @@ from __future__ import annotations
 import argparse
 import json
 import locale
+import sys
+from functools import cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from . import result_checker, run_preparation
 from .calibration import Calibration
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
-def main() -> None:
-    """The main function."""
+# Positional argument, options, and option defaults of each mode, mirroring the subparsers of `_build_parser`.
+_FAST_PATH_MODES: dict[str, tuple[str, dict[str, tuple[str, Callable[[str], object]]], dict[str, object]]] = {
+    "prepare": (
+        "code",
+        {"--output-dir": ("output_dir", Path), "-o": ("output_dir", Path)},
+        {"output_dir": Path()},
+    ),
+    "check": (
+        "results",
+        {
+            "--dir": ("dir", Path),
+            "-d": ("dir", Path),
+            "--slice": ("slice", int),
+            "-s": ("slice", int),
+            "-p": ("p", float),
+        },
+        {"dir": Path(), "slice": 1, "p": 0.05},
+    ),
+    "shots": (
+        "slice",
+        {"-p": ("p", float), "--trials": ("trials", int), "--accuracy": ("accuracy", float)},
+        {"p": 0.05, "trials": 1000, "accuracy": 0.95},
+    ),
+}
+
+
+@cache
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Compile assertion programs for real hardware.")
     subparsers = parser.add_subparsers(dest="mode", required=True, help="The mode to run the program in.")
     parser.add_argument(
@@ -57,8 +88,56 @@ def main() -> None:
     sub_checker.add_argument(
         "--accuracy", type=float, help="The desired accuracy to report a sample count.", default=0.95
     )
+    return parser
+
+
+def _fast_parse_args(argv: list[str]) -> argparse.Namespace | None:
+    """Parse the command line arguments without building the full argument parser.
+
+    Only plain invocations of a known mode are handled here. Anything else, including help requests, abbreviated or
+    combined options, and invalid values, is left to the argument parser.
 
-    args = parser.parse_args()
+    Args:
+        argv (list[str]): The command line arguments, excluding the program name.
+
+    Returns:
+        argparse.Namespace | None: The parsed arguments, or None if the arguments have to be parsed by the argument parser.
+    """
+    values: dict[str, object] = {"calibration": None}
+    if len(argv) >= 2 and argv[0] == "--calibration" and not argv[1].startswith("-"):
+        values["calibration"] = Path(argv[1])
+        argv = argv[2:]
+    if not argv or argv[0] not in _FAST_PATH_MODES:
+        return None
+
+    positional, options, defaults = _FAST_PATH_MODES[argv[0]]
+    values.update(defaults, mode=argv[0])
+    tokens = iter(argv[1:])
+    for token in tokens:
+        if not token.startswith("-"):
+            if positional in values:
+                return None
+            values[positional] = Path(token)
+            continue
+        value = next(tokens, None)
+        if token not in options or value is None or value.startswith("-"):
+            return None
+        dest, convert = options[token]
+        try:
+            values[dest] = convert(value)
+        except ValueError:
+            return None
+
+    if positional not in values:
+        return None
+    return argparse.Namespace(**values)
+
+
+def main() -> None:
+    """The main function."""
+    args = _fast_parse_args(sys.argv[1:])
+    if args is None:
+        args = _build_parser().parse_args()
 
     if args.calibration is not None:
         with args.calibration.open("r") as f:
@@ -10,7 +10,32 @@
 
 from __future__ import annotations
 
+import importlib
+from typing import TYPE_CHECKING
+
 from . import messages
-from .dap_server import DAPServer
+
+if TYPE_CHECKING:
+    from .dap_server import DAPServer
 
 __all__ = ["DAPServer", "messages"]
+
+
+def __getattr__(name: str) -> type:
+    """Import the DAP server on first access.
+
+    Args:
+        name (str): The name of the requested attribute.
+
+    Returns:
+        type: The requested class.
+
+    Raises:
+        AttributeError: If `name` is not a lazily loaded class.
+    """
+    if name == "DAPServer":
+        server: type = importlib.import_module(".dap_server", __name__).DAPServer
+        globals()[name] = server
+        return server
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
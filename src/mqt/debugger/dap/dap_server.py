@@ -13,18 +13,48 @@ from __future__ import annotations
 import json
 import socket
 import sys
-from typing import Any, cast
+from bisect import bisect_right
+from typing import TYPE_CHECKING, Any
 
 import mqt.debugger
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .messages import DAPMessage
+
+try:
+    from orjson import dumps as json_dumps
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads  # type: ignore[assignment]
+
+    def json_dumps(obj: object) -> bytes:  # type: ignore[misc]
+        """Serialize an object to UTF-8 encoded JSON.
+
+        Non-ASCII characters are escaped by `json.dumps`, so the output is plain ASCII.
+
+        Args:
+            obj (object): The object to serialize.
+
+        Returns:
+            bytes: The serialized object.
+        """
+        return json.dumps(obj).encode("ascii")
+
+
 from .messages import (
     ConfigurationDoneDAPMessage,
     ContinueDAPMessage,
     DisconnectDAPMessage,
     ExceptionInfoDAPMessage,
+    ExitedDAPEvent,
+    GrayOutDAPEvent,
     InitializeDAPMessage,
+    InitializedDAPEvent,
     LaunchDAPMessage,
     NextDAPMessage,
+    OutputDAPEvent,
     PauseDAPMessage,
     Request,
     RestartDAPMessage,
@@ -37,7 +67,10 @@ from .messages import (
     StepBackDAPMessage,
     StepInDAPMessage,
     StepOutDAPMessage,
+    StoppedDAPEvent,
+    StopReason,
     TerminateDAPMessage,
+    TerminatedDAPEvent,
     ThreadsDAPMessage,
     VariablesDAPMessage,
 )
@@ -66,18 +99,116 @@ supported_messages: list[type[Request]] = [
     RestartFrameDAPMessage,
 ]
 
+_message_types_by_command: dict[str, type[Request]] = {
+    message_type.message_type_name: message_type for message_type in supported_messages
+}
+
+# Events without any runtime data are serialized only once.
+_INITIALIZED_EVENT = json_dumps(InitializedDAPEvent().encode())
+_ENTRY_STOPPED_EVENT = json_dumps(StoppedDAPEvent(StopReason.ENTRY, "Stopped on entry").encode())
+_PAUSE_STOPPED_EVENT = json_dumps(StoppedDAPEvent(StopReason.PAUSE, "Stopped after pause").encode())
+_TERMINATED_EVENT = json_dumps(TerminatedDAPEvent().encode())
+_TERMINATED_EXITED_EVENT = json_dumps(ExitedDAPEvent(143).encode())
+_FINISHED_EXITED_EVENT = json_dumps(ExitedDAPEvent(0).encode())
 
-def send_message(msg: str, client: socket.socket) -> None:
+
+def send_message(msg: bytes, client: socket.socket | MessageBuffer) -> None:
     """Send a message to the client according to the DAP messaging protocol.
 
     Args:
-        msg (str): The message to send.
-        client (socket.socket): The client socket to send the message to.
+        msg (bytes): The UTF-8 encoded JSON message to send.
+        client (socket.socket | MessageBuffer): The client socket or message buffer to send the message to.
     """
-    msg = msg.replace("\n", "\r\n")
-    length = len(msg)
-    header = f"Content-Length: {length}\r\n\r\n".encode("ascii")
-    client.sendall(header + msg.encode("utf-8"))
+    client.sendall(b"Content-Length: %d\r\n\r\n%b" % (len(msg), msg))
+
+
+class MessageBuffer:
+    """Collects the messages sent to a client and sends them at once."""
+
+    client: socket.socket
+    frames: list[bytes]
+
+    def __init__(self, client: socket.socket) -> None:
+        """Create a new message buffer.
+
+        Args:
+            client (socket.socket): The client socket to send the messages to.
+        """
+        self.client = client
+        self.frames = []
+
+    def sendall(self, data: bytes) -> None:
+        """Add data to the buffer.
+
+        Args:
+            data (bytes): The data to send.
+        """
+        self.frames.append(data)
+
+    def flush(self) -> None:
+        """Send all buffered data to the client."""
+        if self.frames:
+            self.client.sendall(b"".join(self.frames))
+            self.frames.clear()
+
+
+class MessageReader:
+    """Receives messages from a client according to the DAP messaging protocol."""
+
+    client: socket.socket
+    buffer: bytearray
+    chunk: bytearray
+
+    def __init__(self, client: socket.socket, chunk_size: int = 65536) -> None:
+        """Create a new message reader.
+
+        Args:
+            client (socket.socket): The client socket to receive the messages from.
+            chunk_size (int, optional): The maximum number of bytes to receive at once. Defaults to 65536.
+        """
+        self.client = client
+        self.buffer = bytearray()
+        self.chunk = bytearray(chunk_size)
+
+    def read(self) -> bytearray | None:
+        """Receive the next message from the client.
+
+        Bytes received beyond the end of the message are kept for the following messages.
+
+        Raises:
+            RuntimeError: If the message header does not specify the content length.
+
+        Returns:
+            bytearray | None: The UTF-8 encoded JSON content of the message, or None if the client closed the connection.
+        """
+        buffer = self.buffer
+        while (header_end := buffer.find(b"\r\n\r\n")) == -1:
+            if not self._receive():
+                return None
+
+        content_length = -1
+        for field in buffer[:header_end].split(b"\r\n"):
+            name, _, value = field.partition(b":")
+            if name.strip() == b"Content-Length":
+                content_length = int(value)
+        if content_length < 0:
+            msg = "Received a message without a valid Content-Length header"
+            raise RuntimeError(msg)
+
+        content_start = header_end + 4
+        content_end = content_start + content_length
+        while len(buffer) < content_end:
+            if not self._receive():
+                return None
+        content = buffer[content_start:content_end]
+        del buffer[:content_end]
+        return content
+
+    def _receive(self) -> bool:
+        received = self.client.recv_into(self.chunk)
+        with memoryview(self.chunk) as chunk:
+            self.buffer += chunk[:received]
+        return received > 0
 
 
 class DAPServer:
@@ -88,9 +219,14 @@ class DAPServer:
 
     simulation_state: mqt.debugger.SimulationState
     source_file: dict[str, Any]
-    source_code: str
+    _source_code: str
+    _line_starts: list[int]
+    _coordinates: dict[int, tuple[int, int]]
+    _instruction_positions: list[tuple[int, int]] | None
+    _num_qubits: int | None
+    _num_classical_variables: int | None
     can_step_back: bool
-    exception_breakpoints: list[str]
+    exception_breakpoints: frozenset[str]
     lines_start_at_one: bool
     columns_start_at_one: bool
 
@@ -104,10 +240,66 @@ class DAPServer:
         self.host = host
         self.port = port
         self.can_step_back = False
+        self.exception_breakpoints = frozenset()
+        self._instruction_positions = None
+        self._num_qubits = None
+        self._num_classical_variables = None
         self.simulation_state = mqt.debugger.SimulationState()
         self.lines_start_at_one = True
         self.columns_start_at_one = True
 
+    @property
+    def source_code(self) -> str:
+        """The source code of the program being debugged."""
+        return self._source_code
+
+    @source_code.setter
+    def source_code(self, code: str) -> None:
+        self._source_code = code
+        self._line_starts = [0]
+        for line in code.split("\n")[:-1]:
+            self._line_starts.append(self._line_starts[-1] + len(line) + 1)
+        self._coordinates = {}
+        self._instruction_positions = None
+        self._num_qubits = None
+        self._num_classical_variables = None
+
+    def get_instruction_positions(self) -> list[tuple[int, int]]:
+        """Get the positions of all instructions in the source code.
+
+        The positions are retrieved from the simulation state only once per loaded program.
+
+        Returns:
+            list[tuple[int, int]]: The start and end positions of each instruction.
+        """
+        if self._instruction_positions is None:
+            self._instruction_positions = self.simulation_state.get_instruction_positions()
+        return self._instruction_positions
+
+    def get_num_qubits(self) -> int:
+        """Get the number of qubits used by the program.
+
+        The number is retrieved from the simulation state only once per loaded program.
+
+        Returns:
+            int: The number of qubits.
+        """
+        if self._num_qubits is None:
+            self._num_qubits = self.simulation_state.get_num_qubits()
+        return self._num_qubits
+
+    def get_num_classical_variables(self) -> int:
+        """Get the number of classical variables used by the program.
+
+        The number is retrieved from the simulation state only once per loaded program.
+
+        Returns:
+            int: The number of classical variables.
+        """
+        if self._num_classical_variables is None:
+            self._num_classical_variables = self.simulation_state.get_num_classical_variables()
+        return self._num_classical_variables
+
     def start(self) -> None:
         """Start the DAP server and listen for one connection."""
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
@@ -126,6 +318,9 @@ class DAPServer:
             try:
                 conn, _addr = s.accept()
                 with conn:
+                    # Events are small and must reach the client immediately.
+                    conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                    conn.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 262144)
                     self.handle_client(conn)
             except RuntimeError:
                 s.close()
@@ -136,118 +331,39 @@ class DAPServer:
         Args:
             connection (socket.socket): The client socket.
         """
-        data_str = ""
-        message_str = ""
+        reader = MessageReader(connection)
+        outgoing = MessageBuffer(connection)
+        # Bind the callables used for every message once, outside of the loop.
+        handle_command = self.handle_command
+        regular_checks = self.regular_checks
+        get_event_sender = _event_senders.get
+        flush = outgoing.flush
         while True:
-            if not message_str or not data_str:
-                data = connection.recv(1024)
-                data_str += data.decode()
-            first_end = data_str.find("Content-Length:", 1)
-            if first_end != -1:
-                message_str = data_str[:first_end]
-                data_str = data_str[first_end:]
-            elif data_str.count("{") == data_str.count("}"):
-                message_str = data_str
-                data_str = ""
-            else:
-                message_str = ""
-                continue
-            parts = message_str.split("\n")
-            if not parts or not data:
+            content = reader.read()
+            if content is None:
                 break
-            payload = json.loads(parts[-1])
-            result, cmd = self.handle_command(payload)
-            result_payload = json.dumps(result)
-            send_message(result_payload, connection)
-
-            e: mqt.debugger.dap.messages.DAPEvent | None = None
-            if isinstance(cmd, mqt.debugger.dap.messages.LaunchDAPMessage):
-                e = mqt.debugger.dap.messages.InitializedDAPEvent()
-                event_payload = json.dumps(e.encode())
-                send_message(event_payload, connection)
-            if (
-                isinstance(
-                    cmd, (mqt.debugger.dap.messages.LaunchDAPMessage, mqt.debugger.dap.messages.RestartDAPMessage)
-                )
-                and cmd.stop_on_entry
-            ):
-                e = mqt.debugger.dap.messages.StoppedDAPEvent(
-                    mqt.debugger.dap.messages.StopReason.ENTRY, "Stopped on entry"
-                )
-                event_payload = json.dumps(e.encode())
-                send_message(event_payload, connection)
-            if isinstance(
-                cmd,
-                (
-                    mqt.debugger.dap.messages.NextDAPMessage,
-                    mqt.debugger.dap.messages.StepBackDAPMessage,
-                    mqt.debugger.dap.messages.StepInDAPMessage,
-                    mqt.debugger.dap.messages.StepOutDAPMessage,
-                    mqt.debugger.dap.messages.ContinueDAPMessage,
-                    mqt.debugger.dap.messages.ReverseContinueDAPMessage,
-                    mqt.debugger.dap.messages.RestartFrameDAPMessage,
-                ),
-            ) or (
-                isinstance(
-                    cmd,
-                    (
-                        mqt.debugger.dap.messages.LaunchDAPMessage,
-                        mqt.debugger.dap.messages.RestartDAPMessage,
-                    ),
-                )
-                and not cmd.stop_on_entry
-            ):
-                event = (
-                    mqt.debugger.dap.messages.StopReason.EXCEPTION
-                    if self.simulation_state.did_assertion_fail()
-                    else mqt.debugger.dap.messages.StopReason.BREAKPOINT_INSTRUCTION
-                    if self.simulation_state.was_breakpoint_hit()
-                    else mqt.debugger.dap.messages.StopReason.STEP
-                )
-                message = (
-                    "An assertion failed"
-                    if self.simulation_state.did_assertion_fail()
-                    else "Stopped at breakpoint"
-                    if self.simulation_state.was_breakpoint_hit()
-                    else "Stopped after step"
-                )
-                e = mqt.debugger.dap.messages.StoppedDAPEvent(event, message)
-                event_payload = json.dumps(e.encode())
-                send_message(event_payload, connection)
-                if self.simulation_state.did_assertion_fail():
-                    self.handle_assertion_fail(connection)
-            if isinstance(cmd, mqt.debugger.dap.messages.TerminateDAPMessage):
-                e = mqt.debugger.dap.messages.TerminatedDAPEvent()
-                event_payload = json.dumps(e.encode())
-                send_message(event_payload, connection)
-                e = mqt.debugger.dap.messages.ExitedDAPEvent(143)
-                event_payload = json.dumps(e.encode())
-                send_message(event_payload, connection)
-            if isinstance(cmd, mqt.debugger.dap.messages.PauseDAPMessage):
-                e = mqt.debugger.dap.messages.StoppedDAPEvent(
-                    mqt.debugger.dap.messages.StopReason.PAUSE, "Stopped after pause"
-                )
-                event_payload = json.dumps(e.encode())
-                send_message(event_payload, connection)
-            self.regular_checks(connection)
-
-    def regular_checks(self, connection: socket.socket) -> None:
+            payload = json_loads(content)
+            result, cmd = handle_command(payload)
+            result_payload = json_dumps(result)
+            send_message(result_payload, outgoing)
+
+            send_events = get_event_sender(type(cmd))
+            if send_events is not None:
+                send_events(self, cmd, outgoing)
+            regular_checks(outgoing)
+            flush()
+
+    def regular_checks(self, connection: MessageBuffer) -> None:
         """Perform regular checks and send events to the client if necessary.
 
         Args:
-            connection (socket.socket): The client socket.
+            connection (MessageBuffer): The buffer for messages to the client.
         """
-        e: mqt.debugger.dap.messages.DAPEvent | None = None
         if self.simulation_state.is_finished() and self.simulation_state.get_instruction_count() != 0:
-            e = mqt.debugger.dap.messages.ExitedDAPEvent(0)
-            event_payload = json.dumps(e.encode())
-            send_message(event_payload, connection)
-        if self.can_step_back != self.simulation_state.can_step_backward():
-            self.can_step_back = self.simulation_state.can_step_backward()
-            e = mqt.debugger.dap.messages.CapabilitiesDAPEvent({"supportsStepBack": self.can_step_back})
-            event_payload = json.dumps(e.encode())
-
-    def handle_command(self, command: dict[str, Any]) -> tuple[dict[str, Any], mqt.debugger.dap.messages.DAPMessage]:
+            send_message(_FINISHED_EXITED_EVENT, connection)
+        self.can_step_back = self.simulation_state.can_step_backward()
+
+    def handle_command(self, command: dict[str, Any]) -> tuple[dict[str, Any], DAPMessage]:
         """Handle an incoming command from the client and return the corresponding response.
 
         Args:
@@ -257,32 +373,29 @@ class DAPServer:
             RuntimeError: If the command is not supported.
 
         Returns:
-            tuple[dict[str, Any], mqt.debugger.dap.messages.DAPMessage]: The response to the message as a dictionary and the message object.
+            tuple[dict[str, Any], DAPMessage]: The response to the message as a dictionary and the message object.
         """
-        for message_type in supported_messages:
-            if message_type.message_type_name == command["command"]:
-                message = message_type(command)
-                return (message.handle(self), message)
-        msg = f"Unsupported command: {command['command']}"
-        raise RuntimeError(msg)
-
-    def handle_assertion_fail(self, connection: socket.socket) -> None:
+        message_type = _message_types_by_command.get(command["command"])
+        if message_type is None:
+            msg = f"Unsupported command: {command['command']}"
+            raise RuntimeError(msg)
+        message = message_type(command)
+        return (message.handle(self), message)
+
+    def handle_assertion_fail(self, connection: MessageBuffer) -> None:
         """Handles the sending of output events when an assertion fails.
 
         Args:
-            connection (socket.socket): The client socket.
+            connection (MessageBuffer): The buffer for messages to the client.
         """
         current_instruction = self.simulation_state.get_current_instruction()
-        dependencies = self.simulation_state.get_diagnostics().get_data_dependencies(current_instruction)
-        gray_out_areas: list[tuple[int, int]] = []
-        for i in range(self.simulation_state.get_instruction_count()):
-            if i in dependencies:
-                continue
-            start, end = self.simulation_state.get_instruction_position(i)
-            gray_out_areas.append((start, end))
-
-        e = mqt.debugger.dap.messages.GrayOutDAPEvent(gray_out_areas, self.source_file)
-        event_payload = json.dumps(e.encode())
+        dependencies = set(self.simulation_state.get_diagnostics().get_data_dependencies(current_instruction))
+        gray_out_areas = [
+            position for i, position in enumerate(self.get_instruction_positions()) if i not in dependencies
+        ]
+
+        e = GrayOutDAPEvent(gray_out_areas, self.source_file)
+        event_payload = json_dumps(e.encode())
         send_message(event_payload, connection)
 
         error_causes = self.simulation_state.get_diagnostics().potential_error_causes()
@@ -320,19 +433,30 @@ class DAPServer:
         Returns:
             tuple[int, int]: The line and column, 0-or-1-indexed.
         """
-        lines = self.source_code.split("\n")
-        line = 0
-        col = 0
-        for i, line_code in enumerate(lines):
-            if pos < len(line_code):
-                line = i + 1
-                col = pos
-                break
-            pos -= len(line_code) + 1
-        if self.columns_start_at_one:
-            col += 1
-        if not self.lines_start_at_one:
-            line -= 1
+        coordinates = self._coordinates.get(pos)
+        if coordinates is None:
+            coordinates = self._coordinates[pos] = self._locate(pos)
+        line, col = coordinates
+        # The flags are used as 0/1 offsets for the client's indexing convention.
+        return (line - (not self.lines_start_at_one), col + self.columns_start_at_one)
+
+    def _locate(self, pos: int) -> tuple[int, int]:
+        """Find the 1-indexed line and 0-indexed column of a code position.
+
+        Args:
+            pos (int): The 0-indexed position in the code.
+
+        Returns:
+            tuple[int, int]: The line and column, independent of the client's indexing convention.
+        """
+        line_starts = self._line_starts
+        line = max(bisect_right(line_starts, pos), 1)
+        col = pos - line_starts[line - 1]
+        if line < len(line_starts) and pos == line_starts[line] - 1:
+            # The line break at the end of a line is attributed to the following line.
+            return (line + 1, -1)
+        if line == len(line_starts) and col >= len(self._source_code) - line_starts[-1]:
+            return (0, 0)
         return (line, col)
 
     def code_coordinates_to_pos(self, line: int, col: int) -> int:
@@ -345,16 +469,14 @@ class DAPServer:
         Returns:
             int: The 0-indexed position in the code.
         """
-        lines = self.source_code.split("\n")
-        if not self.lines_start_at_one:
-            line += 1
-        pos = 0
-        for line_index in range(line - 1):
-            pos += len(lines[line_index]) + 1
-        pos += col
-        if self.columns_start_at_one:
-            pos -= 1
-        return pos
+        line += not self.lines_start_at_one
+        col -= self.columns_start_at_one
+        if line < 1:
+            return col
+        if line > len(self._line_starts):
+            # Lines past the end of the code are placed right after it, as the line-by-line summation would.
+            return len(self._source_code) + 1 + col
+        return self._line_starts[line - 1] + col
 
     def format_error_cause(self, cause: mqt.debugger.ErrorCause) -> str:
         """Format an error cause for output.
@@ -376,7 +498,7 @@ class DAPServer:
         )
 
     def send_message_hierarchy(
-        self, message: dict[str, str | list[Any] | dict[str, Any]], line: int, column: int, connection: socket.socket
+        self, message: dict[str, str | list[Any] | dict[str, Any]], line: int, column: int, connection: MessageBuffer
     ) -> None:
         """Send a hierarchy of messages to the client.
 
@@ -384,35 +506,134 @@ class DAPServer:
             message (dict[str, str | list[str], dict[str, Any]]): An object representing the message to send. Supported keys are "title", "body", "end".
             line (int): The line number.
             column (int): The column number.
-            connection (socket.socket): The client socket.
+            connection (MessageBuffer): The buffer for messages to the client.
         """
-        if "title" in message:
-            title_event = mqt.debugger.dap.messages.OutputDAPEvent(
-                "console", cast("str", message["title"]), "start", line, column, self.source_file
-            )
-            send_message(json.dumps(title_event.encode()), connection)
-
-        if "body" in message:
-            body = message["body"]
-            if isinstance(body, list):
-                for msg in body:
-                    if isinstance(msg, dict):
-                        self.send_message_hierarchy(msg, line, column, connection)
-                    else:
-                        output_event = mqt.debugger.dap.messages.OutputDAPEvent(
-                            "console", msg, None, line, column, self.source_file
-                        )
-                        send_message(json.dumps(output_event.encode()), connection)
-            elif isinstance(body, dict):
-                self.send_message_hierarchy(body, line, column, connection)
-            elif isinstance(body, str):
-                output_event = mqt.debugger.dap.messages.OutputDAPEvent(
-                    "console", body, None, line, column, self.source_file
-                )
-                send_message(json.dumps(output_event.encode()), connection)
-
-        if "end" in message or "title" in message:
-            end_event = mqt.debugger.dap.messages.OutputDAPEvent(
-                "console", cast("str", message.get("end")), "end", line, column, self.source_file
-            )
-            send_message(json.dumps(end_event.encode()), connection)
+        event = OutputDAPEvent("console", None, None, line, column, self.source_file).encode()
+        _send_output_hierarchy(message, event, connection)
+
+
+def _send_output_hierarchy(
+    message: dict[str, str | list[Any] | dict[str, Any]], event: dict[str, Any], connection: MessageBuffer
+) -> None:
+    """Send a hierarchy of messages to the client as 'output' events.
+
+    All events share the given encoded event, of which only the output text and group are replaced for each message.
+
+    Args:
+        message (dict[str, str | list[str], dict[str, Any]]): An object representing the message to send. Supported keys are "title", "body", "end".
+        event (dict[str, Any]): The encoded 'output' event to send the messages with.
+        connection (MessageBuffer): The buffer for messages to the client.
+    """
+    output = event["body"]
+    if "title" in message:
+        output["output"] = message["title"]
+        output["group"] = "start"
+        send_message(json_dumps(event), connection)
+
+    if "body" in message:
+        body = message["body"]
+        if isinstance(body, list):
+            for msg in body:
+                if isinstance(msg, dict):
+                    _send_output_hierarchy(msg, event, connection)
+                else:
+                    output["output"] = msg
+                    output["group"] = None
+                    send_message(json_dumps(event), connection)
+        elif isinstance(body, dict):
+            _send_output_hierarchy(body, event, connection)
+        elif isinstance(body, str):
+            output["output"] = body
+            output["group"] = None
+            send_message(json_dumps(event), connection)
+
+    if "end" in message or "title" in message:
+        output["output"] = message.get("end")
+        output["group"] = "end"
+        send_message(json_dumps(event), connection)
+
+
+def _send_launch_events(server: DAPServer, cmd: LaunchDAPMessage, connection: MessageBuffer) -> None:
+    """Send the events that follow a 'launch' request.
+
+    Args:
+        server (DAPServer): The DAP server that handled the request.
+        cmd (LaunchDAPMessage): The handled request.
+        connection (MessageBuffer): The buffer for messages to the client.
+    """
+    send_message(_INITIALIZED_EVENT, connection)
+    _send_start_events(server, cmd, connection)
+
+
+def _send_start_events(server: DAPServer, cmd: LaunchDAPMessage | RestartDAPMessage, connection: MessageBuffer) -> None:
+    """Send the events that follow the start of a new debugging session.
+
+    Args:
+        server (DAPServer): The DAP server that handled the request.
+        cmd (LaunchDAPMessage | RestartDAPMessage): The handled request.
+        connection (MessageBuffer): The buffer for messages to the client.
+    """
+    if not cmd.stop_on_entry:
+        _send_stopped_event(server, cmd, connection)
+        return
+    send_message(_ENTRY_STOPPED_EVENT, connection)
+
+
+def _send_stopped_event(server: DAPServer, _cmd: Request, connection: MessageBuffer) -> None:
+    """Send the 'stopped' event after the execution advanced.
+
+    Args:
+        server (DAPServer): The DAP server that handled the request.
+        _cmd (Request): The handled request.
+        connection (MessageBuffer): The buffer for messages to the client.
+    """
+    assertion_failed = server.simulation_state.did_assertion_fail()
+    if assertion_failed:
+        event, message = StopReason.EXCEPTION, "An assertion failed"
+    elif server.simulation_state.was_breakpoint_hit():
+        event, message = StopReason.BREAKPOINT_INSTRUCTION, "Stopped at breakpoint"
+    else:
+        event, message = StopReason.STEP, "Stopped after step"
+    e = StoppedDAPEvent(event, message)
+    send_message(json_dumps(e.encode()), connection)
+    if assertion_failed:
+        server.handle_assertion_fail(connection)
+
+
+def _send_terminate_events(_server: DAPServer, _cmd: TerminateDAPMessage, connection: MessageBuffer) -> None:
+    """Send the events that follow a 'terminate' request.
+
+    Args:
+        _server (DAPServer): The DAP server that handled the request.
+        _cmd (TerminateDAPMessage): The handled request.
+        connection (MessageBuffer): The buffer for messages to the client.
+    """
+    send_message(_TERMINATED_EVENT, connection)
+    send_message(_TERMINATED_EXITED_EVENT, connection)
+
+
+def _send_pause_event(_server: DAPServer, _cmd: PauseDAPMessage, connection: MessageBuffer) -> None:
+    """Send the 'stopped' event that follows a 'pause' request.
+
+    Args:
+        _server (DAPServer): The DAP server that handled the request.
+        _cmd (PauseDAPMessage): The handled request.
+        connection (MessageBuffer): The buffer for messages to the client.
+    """
+    send_message(_PAUSE_STOPPED_EVENT, connection)
+
+
+# The events to send after handling a request, keyed by the exact type of the request.
+_event_senders: dict[type[Request], Callable[[DAPServer, Any, MessageBuffer], None]] = {
+    LaunchDAPMessage: _send_launch_events,
+    RestartDAPMessage: _send_start_events,
+    NextDAPMessage: _send_stopped_event,
+    StepBackDAPMessage: _send_stopped_event,
+    StepInDAPMessage: _send_stopped_event,
+    StepOutDAPMessage: _send_stopped_event,
+    ContinueDAPMessage: _send_stopped_event,
+    ReverseContinueDAPMessage: _send_stopped_event,
+    RestartFrameDAPMessage: _send_stopped_event,
+    TerminateDAPMessage: _send_terminate_events,
+    PauseDAPMessage: _send_pause_event,
+}
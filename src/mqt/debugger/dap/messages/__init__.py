@@ -10,38 +10,78 @@
 
 from __future__ import annotations
 
-from .capabilities_dap_event import CapabilitiesDAPEvent
-from .configuration_done_dap_message import ConfigurationDoneDAPMessage
-from .continue_dap_message import ContinueDAPMessage
-from .dap_event import DAPEvent
-from .dap_message import DAPMessage
-from .disconnect_dap_message import DisconnectDAPMessage
-from .exception_info_message import ExceptionInfoDAPMessage
-from .exited_dap_event import ExitedDAPEvent
-from .gray_out_event import GrayOutDAPEvent
-from .initialize_dap_message import InitializeDAPMessage
-from .initialized_dap_event import InitializedDAPEvent
-from .launch_dap_message import LaunchDAPMessage
-from .next_dap_message import NextDAPMessage
-from .output_dap_event import OutputDAPEvent
-from .pause_dap_message import PauseDAPMessage
-from .restart_dap_message import RestartDAPMessage
-from .restart_frame_dap_message import RestartFrameDAPMessage
-from .reverse_continue_dap_message import ReverseContinueDAPMessage
-from .scopes_dap_message import ScopesDAPMessage
-from .set_breakpoints_dap_message import SetBreakpointsDAPMessage
-from .set_exception_breakpoints_dap_message import SetExceptionBreakpointsDAPMessage
-from .stack_trace_dap_message import StackTraceDAPMessage
-from .step_back_dap_message import StepBackDAPMessage
-from .step_in_dap_message import StepInDAPMessage
-from .step_out_dap_message import StepOutDAPMessage
-from .stopped_dap_event import StoppedDAPEvent, StopReason
-from .terminate_dap_message import TerminateDAPMessage
-from .terminated_dap_event import TerminatedDAPEvent
-from .threads_dap_message import ThreadsDAPMessage
-from .variables_dap_message import VariablesDAPMessage
+import importlib
+from typing import TYPE_CHECKING
 
-Request = DAPMessage
+if TYPE_CHECKING:
+    from .capabilities_dap_event import CapabilitiesDAPEvent
+    from .configuration_done_dap_message import ConfigurationDoneDAPMessage
+    from .continue_dap_message import ContinueDAPMessage
+    from .dap_event import DAPEvent
+    from .dap_message import DAPMessage
+    from .disconnect_dap_message import DisconnectDAPMessage
+    from .exception_info_message import ExceptionInfoDAPMessage
+    from .exited_dap_event import ExitedDAPEvent
+    from .gray_out_event import GrayOutDAPEvent
+    from .initialize_dap_message import InitializeDAPMessage
+    from .initialized_dap_event import InitializedDAPEvent
+    from .launch_dap_message import LaunchDAPMessage
+    from .next_dap_message import NextDAPMessage
+    from .output_dap_event import OutputDAPEvent
+    from .pause_dap_message import PauseDAPMessage
+    from .restart_dap_message import RestartDAPMessage
+    from .restart_frame_dap_message import RestartFrameDAPMessage
+    from .reverse_continue_dap_message import ReverseContinueDAPMessage
+    from .scopes_dap_message import ScopesDAPMessage
+    from .set_breakpoints_dap_message import SetBreakpointsDAPMessage
+    from .set_exception_breakpoints_dap_message import SetExceptionBreakpointsDAPMessage
+    from .stack_trace_dap_message import StackTraceDAPMessage
+    from .step_back_dap_message import StepBackDAPMessage
+    from .step_in_dap_message import StepInDAPMessage
+    from .step_out_dap_message import StepOutDAPMessage
+    from .stopped_dap_event import StoppedDAPEvent, StopReason
+    from .terminate_dap_message import TerminateDAPMessage
+    from .terminated_dap_event import TerminatedDAPEvent
+    from .threads_dap_message import ThreadsDAPMessage
+    from .variables_dap_message import VariablesDAPMessage
+
+    Request = DAPMessage
+
+# The submodule defining each message type. The submodules are only imported once one of their types is accessed.
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "CapabilitiesDAPEvent": "capabilities_dap_event",
+    "ConfigurationDoneDAPMessage": "configuration_done_dap_message",
+    "ContinueDAPMessage": "continue_dap_message",
+    "DAPEvent": "dap_event",
+    "DAPMessage": "dap_message",
+    "DisconnectDAPMessage": "disconnect_dap_message",
+    "ExceptionInfoDAPMessage": "exception_info_message",
+    "ExitedDAPEvent": "exited_dap_event",
+    "GrayOutDAPEvent": "gray_out_event",
+    "InitializeDAPMessage": "initialize_dap_message",
+    "InitializedDAPEvent": "initialized_dap_event",
+    "LaunchDAPMessage": "launch_dap_message",
+    "NextDAPMessage": "next_dap_message",
+    "OutputDAPEvent": "output_dap_event",
+    "PauseDAPMessage": "pause_dap_message",
+    "RestartDAPMessage": "restart_dap_message",
+    "RestartFrameDAPMessage": "restart_frame_dap_message",
+    "ReverseContinueDAPMessage": "reverse_continue_dap_message",
+    "ScopesDAPMessage": "scopes_dap_message",
+    "SetBreakpointsDAPMessage": "set_breakpoints_dap_message",
+    "SetExceptionBreakpointsDAPMessage": "set_exception_breakpoints_dap_message",
+    "StackTraceDAPMessage": "stack_trace_dap_message",
+    "StepBackDAPMessage": "step_back_dap_message",
+    "StepInDAPMessage": "step_in_dap_message",
+    "StepOutDAPMessage": "step_out_dap_message",
+    "StopReason": "stopped_dap_event",
+    "StoppedDAPEvent": "stopped_dap_event",
+    "TerminateDAPMessage": "terminate_dap_message",
+    "TerminatedDAPEvent": "terminated_dap_event",
+    "ThreadsDAPMessage": "threads_dap_message",
+    "VariablesDAPMessage": "variables_dap_message",
+    "Request": "dap_message",
+}
 
 __all__ = [
     "CapabilitiesDAPEvent",
@@ -77,3 +117,34 @@ __all__ = [
     "ThreadsDAPMessage",
     "VariablesDAPMessage",
 ]
+
+
+def __getattr__(name: str) -> type:
+    """Import the submodule defining a message type on first access.
+
+    Args:
+        name (str): The name of the requested attribute.
+
+    Returns:
+        type: The requested message type.
+
+    Raises:
+        AttributeError: If `name` is not a message type of this module.
+    """
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    module = importlib.import_module(f".{module_name}", __name__)
+    value: type = getattr(module, "DAPMessage" if name == "Request" else name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the attributes of this module, including the message types that have not been imported yet.
+
+    Returns:
+        list[str]: The names of the attributes of this module.
+    """
+    return sorted({*globals(), *__all__})
@@ -18,6 +18,8 @@ from .dap_event import DAPEvent
 class CapabilitiesDAPEvent(DAPEvent):
     """Represents the 'capabilities' DAP event."""
 
+    __slots__ = ("changes",)
+
     event_name = "capabilities"
 
     changes: dict[str, Any]
@@ -31,9 +33,6 @@ class CapabilitiesDAPEvent(DAPEvent):
         super().__init__()
         self.changes = changes
 
-    def validate(self) -> None:
-        """Validate the 'capabilities' DAP event message after creation."""
-
     def encode(self) -> dict[str, int]:
         """Encode the 'capabilities' DAP event message as a dictionary.
 
@@ -21,18 +21,9 @@ if TYPE_CHECKING:
 class ConfigurationDoneDAPMessage(DAPMessage):
     """Represents the 'configurationDone' DAP request."""
 
-    message_type_name: str = "configurationDone"
-
-    def __init__(self, message: dict[str, Any]) -> None:
-        """Initializes the 'ConfigurationDoneDAPMessage' instance.
-
-        Args:
-            message (dict[str, Any]): The object representing the 'ConfigurationDone' request.
-        """
-        super().__init__(message)
+    __slots__ = ()
 
-    def validate(self) -> None:
-        """Validates the 'ConfigurationDoneDAPMessage' instance."""
+    message_type_name: str = "configurationDone"
 
     def handle(self, server: DAPServer) -> dict[str, Any]:
         """Performs the action requested by the 'ConfigurationDone' DAP request.
@@ -21,18 +21,9 @@ if TYPE_CHECKING:
 class ContinueDAPMessage(DAPMessage):
     """Represents the 'continue' DAP request."""
 
-    message_type_name: str = "continue"
-
-    def __init__(self, message: dict[str, Any]) -> None:
-        """Initializes the 'ContinueDAPMessage' instance.
-
-        Args:
-            message (dict[str, Any]): The object representing the 'continue' request.
-        """
-        super().__init__(message)
+    __slots__ = ()
 
-    def validate(self) -> None:
-        """Validates the 'ContinueDAPMessage' instance."""
+    message_type_name: str = "continue"
 
     def handle(self, server: DAPServer) -> dict[str, Any]:
         """Performs the action requested by the 'continue' DAP request.
@@ -44,6 +35,4 @@ class ContinueDAPMessage(DAPMessage):
             dict[str, Any]: The response to the request.
         """
         server.simulation_state.run_simulation()
-        d = super().handle(server)
-        d["body"] = {}
-        return d
+        return self.create_response({})
@@ -10,27 +10,34 @@
 
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, ClassVar
 
 
-class DAPEvent(ABC):
+class DAPEvent:
     """Represents a generic DAP event message."""
 
+    __slots__ = ()
+
     event_name: str = "None"
+    event_template: ClassVar[dict[str, Any]] = {"type": "event", "event": "None"}
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        """Precomputes the event fields shared by all instances of the subclass."""
+        super().__init_subclass__(**kwargs)
+        cls.event_template = {"type": "event", "event": cls.event_name}
 
     def __init__(self) -> None:
         """Create a new DAP event message."""
         super().__init__()
         self.validate()
 
-    @abstractmethod
-    def validate(self) -> None:
+    def validate(self) -> None:  # noqa: PLR6301
         """Validate the DAP event message after creation.
 
-        Raises an exception if the message is invalid.
+        Does nothing by default. Subclasses with fields to check override it and raise an exception if the
+        message is invalid.
         """
-        ...
+        return
 
     def encode(self) -> dict[str, Any]:
         """Encode the DAP event message as a dictionary.
@@ -38,4 +45,4 @@ class DAPEvent(ABC):
         Returns:
             dict[str, Any]: The encoded DAP event message.
         """
-        return {"type": "event", "event": self.event_name}
+        return self.event_template.copy()
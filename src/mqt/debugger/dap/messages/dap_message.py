@@ -10,20 +10,27 @@
 
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 if TYPE_CHECKING:
     from .. import DAPServer
 
 
-class DAPMessage(ABC):
+class DAPMessage:
     """Represents a generic DAP request message."""
 
+    __slots__ = ("sequence_number",)
+
     message_type_name: str = "None"
+    response_template: ClassVar[dict[str, Any]] = {"type": "response", "success": True, "command": "None"}
 
     sequence_number: int
 
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        """Precomputes the response fields shared by all instances of the subclass."""
+        super().__init_subclass__(**kwargs)
+        cls.response_template = {"type": "response", "success": True, "command": cls.message_type_name}
+
     def __init__(self, message: dict[str, Any]) -> None:
         """Creates a new DAPMessage.
 
@@ -34,13 +41,13 @@ class DAPMessage(ABC):
         self.sequence_number = message["seq"]
         self.validate()
 
-    @abstractmethod
-    def validate(self) -> None:
+    def validate(self) -> None:  # noqa: PLR6301
         """Validate the DAP request message after creation.
 
-        Raises an exception if the message is invalid.
+        Does nothing by default. Subclasses with fields to check override it and raise an exception if the
+        message is invalid.
         """
-        ...
+        return
 
     def handle(self, _server: DAPServer) -> dict[str, Any]:
         """Performs the action requested by the DAP request message and returns the response.
@@ -51,9 +58,17 @@ class DAPMessage(ABC):
         Returns:
             dict[str, Any]: The response to the request.
         """
-        return {
-            "type": "response",
-            "request_seq": self.sequence_number,
-            "success": True,
-            "command": self.message_type_name,
-        }
+        return self.create_response()
+
+    def create_response(self, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Creates a successful response to the DAP request message.
+
+        Args:
+            body (dict[str, Any] | None, optional): The body of the response. Omitted if None. Defaults to None.
+
+        Returns:
+            dict[str, Any]: The response to the request.
+        """
+        if body is None:
+            return {**self.response_template, "request_seq": self.sequence_number}
+        return {**self.response_template, "request_seq": self.sequence_number, "body": body}
@@ -23,18 +23,9 @@ if TYPE_CHECKING:
 class DisconnectDAPMessage(DAPMessage):
     """Represents the 'disconnect' DAP request."""
 
-    message_type_name: str = "disconnect"
-
-    def __init__(self, message: dict[str, Any]) -> None:
-        """Initializes the 'DisconnectDAPMessage' instance.
-
-        Args:
-            message (dict[str, Any]): The object representing the 'disconnect' request.
-        """
-        super().__init__(message)
+    __slots__ = ()
 
-    def validate(self) -> None:
-        """Validates the 'DisconnectDAPMessage' instance."""
+    message_type_name: str = "disconnect"
 
     def handle(self, server: DAPServer) -> dict[str, Any]:
         """Performs the action requested by the 'disconnect' DAP request.
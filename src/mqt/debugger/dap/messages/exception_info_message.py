@@ -10,6 +10,7 @@
 
 from __future__ import annotations
 
+import re
 from typing import TYPE_CHECKING, Any
 
 from .dap_message import DAPMessage
@@ -23,22 +24,15 @@ ASSERTION_DESCRIPTIONS = {
     "assert-eq": "The given quantum states are not within the given tolerance.",
 }
 
+_ASSERTION_TYPE = re.compile("|".join(re.escape(assertion_type) for assertion_type in ASSERTION_DESCRIPTIONS))
+
 
 class ExceptionInfoDAPMessage(DAPMessage):
     """Represents the 'exceptionInfo' DAP request."""
 
-    message_type_name: str = "exceptionInfo"
-
-    def __init__(self, message: dict[str, Any]) -> None:
-        """Initializes the 'ExceptionInfoDAPMessage' instance.
-
-        Args:
-            message (dict[str, Any]): The object representing the 'exceptionInfo' request.
-        """
-        super().__init__(message)
+    __slots__ = ()
 
-    def validate(self) -> None:
-        """Validates the 'ExceptionInfoDAPMessage' instance."""
+    message_type_name: str = "exceptionInfo"
 
     def handle(self, server: DAPServer) -> dict[str, Any]:
         """Performs the action requested by the 'exceptionInfo' DAP request.
@@ -46,20 +40,25 @@ class ExceptionInfoDAPMessage(DAPMessage):
         Args:
             server (DAPServer): The DAP server that received the request.
 
+        Raises:
+            RuntimeError: If the current instruction is not an assertion.
+
         Returns:
             dict[str, Any]: The response to the request.
         """
         previous_instruction = server.simulation_state.get_current_instruction()
         (start, end) = server.simulation_state.get_instruction_position(previous_instruction)
         instruction = server.source_code[start:end]
-        assertion_type = next(x for x in ("assert-ent", "assert-sup", "assert-eq") if x in instruction)
-        d = super().handle(server)
-        d["body"] = {
+        match = _ASSERTION_TYPE.search(instruction)
+        if match is None:
+            msg = f"The current instruction is not an assertion: {instruction.strip()}"
+            raise RuntimeError(msg)
+        assertion_type = match.group()
+        return self.create_response({
             "exceptionId": instruction.strip(),
             "breakMode": "always",
             "description": ASSERTION_DESCRIPTIONS[assertion_type],
             "details": {
                 "typeName": assertion_type,
             },
-        }
-        return d
+        })
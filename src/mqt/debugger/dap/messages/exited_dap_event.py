@@ -16,6 +16,8 @@ from .dap_event import DAPEvent
 class ExitedDAPEvent(DAPEvent):
     """Represents the 'exited' DAP event."""
 
+    __slots__ = ("exit_code",)
+
     event_name = "exited"
 
     exit_code: int
@@ -29,9 +31,6 @@ class ExitedDAPEvent(DAPEvent):
         super().__init__()
         self.exit_code = exit_code
 
-    def validate(self) -> None:
-        """Validates the 'ExitedDAPEvent' instance."""
-
     def encode(self) -> dict[str, int]:
         """Encodes the 'ExitedDAPEvent' instance as a dictionary.
 
@@ -18,6 +18,8 @@ from .dap_event import DAPEvent
 class GrayOutDAPEvent(DAPEvent):
     """Represents the 'grayOut' DAP event."""
 
+    __slots__ = ("ranges", "source")
+
     event_name = "grayOut"
 
     ranges: list[tuple[int, int]]
@@ -34,9 +36,6 @@ class GrayOutDAPEvent(DAPEvent):
         self.ranges = ranges
         self.source = source
 
-    def validate(self) -> None:
-        """Validate the 'grayOut' DAP event message after creation."""
-
     def encode(self) -> dict[str, str]:
         """Encode the 'grayOut' DAP event message as a dictionary.
 
@@ -24,6 +24,8 @@ if TYPE_CHECKING:
 class InitializeDAPMessage(DAPMessage):
     """Represents the 'initialize' DAP request."""
 
+    __slots__ = ("adapter_id", "client_id", "client_name", "columns_start_at1", "lines_start_at1", "path_format")
+
     message_type_name: str = "initialize"
 
     client_id: str
@@ -69,10 +71,4 @@ class InitializeDAPMessage(DAPMessage):
         server.columns_start_at_one = self.columns_start_at1
         server.lines_start_at_one = self.lines_start_at1
         server.simulation_state = mqt.debugger.create_ddsim_simulation_state()
-        return {
-            "type": "response",
-            "request_seq": self.sequence_number,
-            "success": True,
-            "command": "initialize",
-            "body": get_default_capabilities(),
-        }
+        return self.create_response(get_default_capabilities())
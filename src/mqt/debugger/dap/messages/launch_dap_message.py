@@ -23,6 +23,8 @@ if TYPE_CHECKING:
 class LaunchDAPMessage(DAPMessage):
     """Represents the 'launch' DAP request."""
 
+    __slots__ = ("no_debug", "program", "stop_on_entry")
+
     message_type_name: str = "launch"
 
     no_debug: bool
@@ -70,18 +72,11 @@ class LaunchDAPMessage(DAPMessage):
                 server.simulation_state.load_code(code)
             except RuntimeError:
                 return {
-                    "type": "response",
-                    "request_seq": self.sequence_number,
+                    **self.create_response(),
                     "success": False,
-                    "command": "launch",
                     "message": "An error occurred while parsing the code.",
                 }
         if not self.stop_on_entry:
             server.simulation_state.run_simulation()
         server.source_file = {"name": program_path.name, "path": self.program}
-        return {
-            "type": "response",
-            "request_seq": self.sequence_number,
-            "success": True,
-            "command": "launch",
-        }
+        return self.create_response()
@@ -21,18 +21,9 @@ if TYPE_CHECKING:
 class NextDAPMessage(DAPMessage):
     """Represents the 'next' DAP request."""
 
-    message_type_name: str = "next"
-
-    def __init__(self, message: dict[str, Any]) -> None:
-        """Initializes the 'NextDAPMessage' instance.
-
-        Args:
-            message (dict[str, Any]): The object representing the 'next' request.
-        """
-        super().__init__(message)
+    __slots__ = ()
 
-    def validate(self) -> None:
-        """Validates the 'NextDAPMessage' instance."""
+    message_type_name: str = "next"
 
     def handle(self, server: DAPServer) -> dict[str, Any]:
         """Performs the action requested by the 'next' DAP request.
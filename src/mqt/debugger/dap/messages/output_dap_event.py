@@ -18,6 +18,8 @@ from .dap_event import DAPEvent
 class OutputDAPEvent(DAPEvent):
     """Represents the 'output' DAP event."""
 
+    __slots__ = ("category", "column", "group", "line", "output", "source")
+
     event_name = "output"
 
     category: str
@@ -48,9 +50,6 @@ class OutputDAPEvent(DAPEvent):
         self.column = column
         self.source = source
 
-    def validate(self) -> None:
-        """Validate the 'output' DAP event message after creation."""
-
     def encode(self) -> dict[str, str]:
         """Encode the 'output' DAP event message as a dictionary.
 
@@ -21,18 +21,9 @@ if TYPE_CHECKING:
 class PauseDAPMessage(DAPMessage):
     """Represents the 'pause' DAP request."""
 
-    message_type_name: str = "pause"
-
-    def __init__(self, message: dict[str, Any]) -> None:
-        """Initializes the 'PauseDAPMessage' instance.
-
-        Args:
-            message (dict[str, Any]): The object representing the 'pause' request.
-        """
-        super().__init__(message)
+    __slots__ = ()
 
-    def validate(self) -> None:
-        """Validates the 'PauseDAPMessage' instance."""
+    message_type_name: str = "pause"
 
     def handle(self, server: DAPServer) -> dict[str, Any]:
         """Performs the action requested by the 'pause' DAP request.
@@ -23,6 +23,8 @@ if TYPE_CHECKING:
 class RestartDAPMessage(DAPMessage):
     """Represents the 'restart' DAP request."""
 
+    __slots__ = ("no_debug", "program", "stop_on_entry")
+
     message_type_name: str = "restart"
 
     no_debug: bool
@@ -71,9 +73,4 @@ class RestartDAPMessage(DAPMessage):
         if not self.stop_on_entry:
             server.simulation_state.run_simulation()
         server.source_file = {"name": program_path.name, "path": self.program}
-        return {
-            "type": "response",
-            "request_seq": self.sequence_number,
-            "success": True,
-            "command": "launch",
-        }
+        return self.create_response()
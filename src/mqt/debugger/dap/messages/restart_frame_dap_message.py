@@ -21,6 +21,8 @@ if TYPE_CHECKING:
 class RestartFrameDAPMessage(DAPMessage):
     """Represents the 'restartFrame' DAP request."""
 
+    __slots__ = ("frame",)
+
     message_type_name: str = "restartFrame"
     frame: int
 
@@ -33,9 +35,6 @@ class RestartFrameDAPMessage(DAPMessage):
         super().__init__(message)
         self.frame = message["arguments"]["frameId"]
 
-    def validate(self) -> None:
-        """Validates the 'RestartFrameDAPMessage' instance."""
-
     def handle(self, server: DAPServer) -> dict[str, Any]:
         """Performs the action requested by the 'restartFrame' DAP request.
 
@@ -48,6 +47,4 @@ class RestartFrameDAPMessage(DAPMessage):
         while server.simulation_state.get_stack_depth() >= self.frame:
             server.simulation_state.step_out_backward()
         server.simulation_state.step_forward()
-        d = super().handle(server)
-        d["body"] = {}
-        return d
+        return self.create_response({})
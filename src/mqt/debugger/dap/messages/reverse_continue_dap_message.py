@@ -21,18 +21,9 @@ if TYPE_CHECKING:
 class ReverseContinueDAPMessage(DAPMessage):
     """Represents the 'reverseContinue' DAP request."""
 
-    message_type_name: str = "reverseContinue"
-
-    def __init__(self, message: dict[str, Any]) -> None:
-        """Initializes the 'ReverseContinueDAPMessage' instance.
-
-        Args:
-            message (dict[str, Any]): The object representing the 'reverseContinue' request.
-        """
-        super().__init__(message)
+    __slots__ = ()
 
-    def validate(self) -> None:
-        """Validates the 'ReverseContinueDAPMessage' instance."""
+    message_type_name: str = "reverseContinue"
 
     def handle(self, server: DAPServer) -> dict[str, Any]:
         """Performs the action requested by the 'reverseContinue' DAP request.
@@ -44,6 +35,4 @@ class ReverseContinueDAPMessage(DAPMessage):
             dict[str, Any]: The response to the request.
         """
         server.simulation_state.run_simulation_backward()
-        d = super().handle(server)
-        d["body"] = {}
-        return d
+        return self.create_response({})
@@ -21,6 +21,8 @@ if TYPE_CHECKING:
 class ScopesDAPMessage(DAPMessage):
     """Represents the 'scopes' DAP request."""
 
+    __slots__ = ("frame_id",)
+
     message_type_name: str = "scopes"
 
     frame_id: int
@@ -34,9 +36,6 @@ class ScopesDAPMessage(DAPMessage):
         super().__init__(message)
         self.frame_id = message["arguments"]["frameId"]
 
-    def validate(self) -> None:
-        """Validates the 'ScopesDAPMessage' instance."""
-
     def handle(self, server: DAPServer) -> dict[str, Any]:
         """Performs the action requested by the 'scopes' DAP request.
 
@@ -46,46 +45,40 @@ class ScopesDAPMessage(DAPMessage):
         Returns:
             dict[str, Any]: The response to the request.
         """
-        d = super().handle(server)
-        d["body"] = {"scopes": [_get_classical_scope(server), _get_quantum_state_scope(server)]}
-        return d
-
-
-def _get_classical_scope(server: DAPServer) -> dict[str, Any]:
-    start_pos = 0
-    end_pos = len(server.source_code) - 1
-    start_line, start_col = server.code_pos_to_coordinates(start_pos)
-    end_line, end_col = server.code_pos_to_coordinates(end_pos)
+        start_line, start_col = server.code_pos_to_coordinates(0)
+        end_line, end_col = server.code_pos_to_coordinates(len(server.source_code) - 1)
+        location = {
+            "source": server.source_file,
+            "line": start_line,
+            "column": start_col,
+            "endLine": end_line,
+            "endColumn": end_col,
+        }
+        return self.create_response({
+            "scopes": [_get_classical_scope(server, location), _get_quantum_state_scope(server, location)]
+        })
+
+
+def _get_classical_scope(server: DAPServer, location: dict[str, Any]) -> dict[str, Any]:
     return {
         "name": "Classical Registers",
         "presentationHint": "locals",
         "variablesReference": 1,  # Classical Registers have reference 1
-        "namedVariables": server.simulation_state.get_num_classical_variables(),
+        "namedVariables": server.get_num_classical_variables(),
         "indexedVariables": 0,
         "expensive": False,
-        "source": server.source_file,
-        "line": start_line,
-        "column": start_col,
-        "endLine": end_line,
-        "endColumn": end_col,
+        **location,
     }
 
 
-def _get_quantum_state_scope(server: DAPServer) -> dict[str, Any]:
-    start_pos = 0
-    end_pos = len(server.source_code) - 1
-    start_line, start_col = server.code_pos_to_coordinates(start_pos)
-    end_line, end_col = server.code_pos_to_coordinates(end_pos)
+def _get_quantum_state_scope(server: DAPServer, location: dict[str, Any]) -> dict[str, Any]:
+    num_qubits = server.get_num_qubits()
     return {
         "name": "Quantum State",
         "presentationHint": "registers",
         "variablesReference": 2,  # Quantum state has reference 1
-        "namedVariables": 2 ** server.simulation_state.get_num_qubits(),
+        "namedVariables": 1 << num_qubits,
         "indexedVariables": 0,
-        "expensive": server.simulation_state.get_num_qubits() > 5,
-        "source": server.source_file,
-        "line": start_line,
-        "column": start_col,
-        "endLine": end_line,
-        "endColumn": end_col,
+        "expensive": num_qubits > 5,
+        **location,
     }
@@ -21,6 +21,8 @@ if TYPE_CHECKING:
 class SetBreakpointsDAPMessage(DAPMessage):
     """Represents the 'setBreakpoints' DAP request."""
 
+    __slots__ = ("breakpoints", "source")
+
     message_type_name: str = "setBreakpoints"
 
     breakpoints: list[tuple[int, int]]
@@ -36,9 +38,6 @@ class SetBreakpointsDAPMessage(DAPMessage):
         self.source = message["arguments"]["source"]
         super().__init__(message)
 
-    def validate(self) -> None:
-        """Validates the 'SetBreakpointsDAPMessage' instance."""
-
     def handle(self, server: DAPServer) -> dict[str, Any]:
         """Performs the action requested by the 'setBreakpoints' DAP request.
 
@@ -51,24 +50,25 @@ class SetBreakpointsDAPMessage(DAPMessage):
         if self.source["name"] != server.source_file["name"] or self.source["path"] != server.source_file["path"]:
             return self.handle_wrong_file(server)
 
-        d = super().handle(server)
-
-        server.simulation_state.clear_breakpoints()
+        state = server.simulation_state
+        state.clear_breakpoints()
+        set_breakpoint = state.set_breakpoint
+        get_instruction_position = state.get_instruction_position
+        to_pos = server.code_coordinates_to_pos
+        to_coordinates = server.code_pos_to_coordinates
+        default_column = 1 if server.columns_start_at_one else 0
+        source = self.source
         bpts = []
-        for i, breakpoint_position in enumerate(self.breakpoints):
-            position = server.code_coordinates_to_pos(
-                breakpoint_position[0],
-                breakpoint_position[1] if breakpoint_position[1] != -1 else 1 if server.columns_start_at_one else 0,
-            )
+        for i, (line, column) in enumerate(self.breakpoints):
+            position = to_pos(line, column if column != -1 else default_column)
             try:
-                breakpoint_instruction = server.simulation_state.set_breakpoint(position)
-                start, end = server.simulation_state.get_instruction_position(breakpoint_instruction)
-                start_line, start_col = server.code_pos_to_coordinates(start)
-                end_line, end_col = server.code_pos_to_coordinates(end)
+                start, end = get_instruction_position(set_breakpoint(position))
+                start_line, start_col = to_coordinates(start)
+                end_line, end_col = to_coordinates(end)
                 bpts.append({
                     "id": i,
                     "verified": True,
-                    "source": self.source,
+                    "source": source,
                     "line": start_line,
                     "column": start_col,
                     "endLine": end_line,
@@ -76,10 +76,9 @@ class SetBreakpointsDAPMessage(DAPMessage):
                 })
             except RuntimeError:
                 bpts.append({"id": i, "verified": False, "message": "Breakpoint could not be set", "reason": "failed"})
-        d["body"] = {"breakpoints": bpts}
-        return d
+        return self.create_response({"breakpoints": bpts})
 
-    def handle_wrong_file(self, server: DAPServer) -> dict[str, Any]:
+    def handle_wrong_file(self, _server: DAPServer) -> dict[str, Any]:
         """Performs the action requested by the 'setBreakpoints' DAP request when the file is wrong.
 
         Args:
@@ -88,7 +87,6 @@ class SetBreakpointsDAPMessage(DAPMessage):
         Returns:
             dict[str, Any]: The response to the request.
         """
-        d = super().handle(server)
         bpts = []
         for i, _breakpoint in enumerate(self.breakpoints):
             bpts.append({
@@ -97,5 +95,4 @@ class SetBreakpointsDAPMessage(DAPMessage):
                 "message": "Breakpoints only supported in the main file",
                 "reason": "failed",
             })
-        d["body"] = {"breakpoints": bpts}
-        return d
+        return self.create_response({"breakpoints": bpts})
@@ -21,6 +21,8 @@ if TYPE_CHECKING:
 class SetExceptionBreakpointsDAPMessage(DAPMessage):
     """Represents the 'setBreakpoints' DAP request."""
 
+    __slots__ = ("filters",)
+
     message_type_name: str = "setExceptionBreakpoints"
 
     filters: list[str]
@@ -31,14 +33,10 @@ class SetExceptionBreakpointsDAPMessage(DAPMessage):
         Args:
             message (dict[str, Any]): The object representing the 'setExceptionBreakpoints' request.
         """
-        self.filters = message["arguments"].get("filters", []) + [
-            x["filterId"] for x in message["arguments"].get("filterOptions", [])
-        ]
+        arguments = message["arguments"]
+        self.filters = [*arguments.get("filters", ()), *(x["filterId"] for x in arguments.get("filterOptions", ()))]
         super().__init__(message)
 
-    def validate(self) -> None:
-        """Validates the 'SetExceptionBreakpointsDAPMessage' instance."""
-
     def handle(self, server: DAPServer) -> dict[str, Any]:
         """Performs the action requested by the 'setExceptionBreakpoints' DAP request.
 
@@ -48,7 +46,5 @@ class SetExceptionBreakpointsDAPMessage(DAPMessage):
         Returns:
             dict[str, Any]: The response to the request.
         """
-        server.exception_breakpoints = self.filters
-        d = super().handle(server)
-        d["body"] = {"breakpoints": [{"verified": True} for x in self.filters]}
-        return d
+        server.exception_breakpoints = frozenset(self.filters)
+        return self.create_response({"breakpoints": [{"verified": True} for x in self.filters]})
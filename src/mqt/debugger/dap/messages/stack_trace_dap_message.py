@@ -21,18 +21,9 @@ if TYPE_CHECKING:
 class StackTraceDAPMessage(DAPMessage):
     """Represents the 'stackTrace' DAP request."""
 
-    message_type_name: str = "stackTrace"
-
-    def __init__(self, message: dict[str, Any]) -> None:
-        """Initializes the 'StackTraceDAPMessage' instance.
-
-        Args:
-            message (dict[str, Any]): The object representing the 'stackTrace' request.
-        """
-        super().__init__(message)
+    __slots__ = ()
 
-    def validate(self) -> None:
-        """Validates the 'StackTraceDAPMessage' instance."""
+    message_type_name: str = "stackTrace"
 
     def handle(self, server: DAPServer) -> dict[str, Any]:
         """Performs the action requested by the 'stackTrace' DAP request.
@@ -43,21 +34,13 @@ class StackTraceDAPMessage(DAPMessage):
         Returns:
             dict[str, Any]: The response to the request.
         """
-        d = super().handle(server)
-
         stack_frames = []
         depth = server.simulation_state.get_stack_depth()
-        stack_trace = server.simulation_state.get_stack_trace(depth)
-        for i, frame in enumerate(stack_trace):
-            (start, end) = server.simulation_state.get_instruction_position(frame)
+        positions = server.simulation_state.get_stack_trace_positions(depth)
+        for i, (start, end) in enumerate(positions):
             start_line, start_col = server.code_pos_to_coordinates(start)
             end_line, end_col = server.code_pos_to_coordinates(end)
-            if i == len(stack_trace) - 1:
-                name = "main"
-            else:
-                parent_instr = stack_trace[i + 1]
-                (parent_start, parent_end) = server.simulation_state.get_instruction_position(parent_instr)
-                name = server.source_code[parent_start:parent_end].strip().split(" ")[0].strip()
+            name = "main" if i == len(positions) - 1 else _get_first_token(server.source_code, *positions[i + 1])
             stack_frames.append({
                 "id": depth - i,
                 "name": name,
@@ -68,5 +51,11 @@ class StackTraceDAPMessage(DAPMessage):
                 "source": server.source_file,
             })
 
-        d["body"] = {"stackFrames": stack_frames, "totalFrames": depth}
-        return d
+        return self.create_response({"stackFrames": stack_frames, "totalFrames": depth})
+
+
+def _get_first_token(code: str, start: int, end: int) -> str:
+    while start < end and code[start].isspace():
+        start += 1
+    token_end = code.find(" ", start, end)
+    return code[start : end if token_end == -1 else token_end].rstrip()
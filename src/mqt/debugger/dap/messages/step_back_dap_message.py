@@ -21,18 +21,9 @@ if TYPE_CHECKING:
 class StepBackDAPMessage(DAPMessage):
     """Represents the 'stepBack' DAP request."""
 
-    message_type_name: str = "stepBack"
-
-    def __init__(self, message: dict[str, Any]) -> None:
-        """Initializes the 'StepBackDAPMessage' instance.
-
-        Args:
-            message (dict[str, Any]): The object representing the 'stepBack' request.
-        """
-        super().__init__(message)
+    __slots__ = ()
 
-    def validate(self) -> None:
-        """Validates the 'StepBackDAPMessage' instance."""
+    message_type_name: str = "stepBack"
 
     def handle(self, server: DAPServer) -> dict[str, Any]:
         """Performs the action requested by the 'stepBack' DAP request.
@@ -21,18 +21,9 @@ if TYPE_CHECKING:
 class StepInDAPMessage(DAPMessage):
     """Represents the 'stepIn' DAP request."""
 
-    message_type_name: str = "stepIn"
-
-    def __init__(self, message: dict[str, Any]) -> None:
-        """Initializes the 'StepInDAPMessage' instance.
-
-        Args:
-            message (dict[str, Any]): The object representing the 'stepIn' request.
-        """
-        super().__init__(message)
+    __slots__ = ()
 
-    def validate(self) -> None:
-        """Validates the 'StepInDAPMessage' instance."""
+    message_type_name: str = "stepIn"
 
     def handle(self, server: DAPServer) -> dict[str, Any]:
         """Performs the action requested by the 'stepIn' DAP request.
@@ -21,18 +21,9 @@ if TYPE_CHECKING:
 class StepOutDAPMessage(DAPMessage):
     """Represents the 'stepOut' DAP request."""
 
-    message_type_name: str = "stepOut"
-
-    def __init__(self, message: dict[str, Any]) -> None:
-        """Initializes the 'StepOutDAPMessage' instance.
-
-        Args:
-            message (dict[str, Any]): The object representing the 'stepOut' request.
-        """
-        super().__init__(message)
+    __slots__ = ()
 
-    def validate(self) -> None:
-        """Validates the 'StepOutDAPMessage' instance."""
+    message_type_name: str = "stepOut"
 
     def handle(self, server: DAPServer) -> dict[str, Any]:
         """Performs the action requested by the 'stepOut' DAP request.
@@ -15,7 +15,7 @@ import enum
 from .dap_event import DAPEvent
 
 
-class StopReason(enum.Enum):
+class StopReason(str, enum.Enum):
     """Represents the reason for stopping."""
 
     STEP = "step"
@@ -32,6 +32,8 @@ class StopReason(enum.Enum):
 class StoppedDAPEvent(DAPEvent):
     """Represents the 'stopped' DAP event."""
 
+    __slots__ = ("description", "reason")
+
     event_name = "stopped"
 
     reason: StopReason
@@ -48,9 +50,6 @@ class StoppedDAPEvent(DAPEvent):
         self.reason = reason
         self.description = description
 
-    def validate(self) -> None:
-        """Validate the 'stopped' DAP event message after creation."""
-
     def encode(self) -> dict[str, str]:
         """Encode the 'stopped' DAP event message as a dictionary.
 
@@ -58,10 +57,11 @@ class StoppedDAPEvent(DAPEvent):
             dict[str, str]: The encoded 'stopped' DAP event message.
         """
         d = super().encode()
-        d["body"] = {}
-        d["body"]["reason"] = self.reason.value
-        d["body"]["description"] = self.description
-        d["body"]["threadId"] = 1
-        d["body"]["text"] = self.description
-        d["body"]["allThreadsStopped"] = True
+        d["body"] = {
+            "reason": self.reason,
+            "description": self.description,
+            "threadId": 1,
+            "text": self.description,
+            "allThreadsStopped": True,
+        }
         return d
@@ -23,18 +23,9 @@ if TYPE_CHECKING:
 class TerminateDAPMessage(DAPMessage):
     """Represents the 'terminate' DAP request."""
 
-    message_type_name: str = "terminate"
-
-    def __init__(self, message: dict[str, Any]) -> None:
-        """Initializes the 'TerminateDAPMessage' instance.
-
-        Args:
-            message (dict[str, Any]): The object representing the 'terminate' request.
-        """
-        super().__init__(message)
+    __slots__ = ()
 
-    def validate(self) -> None:
-        """Validates the 'TerminateDAPMessage' instance."""
+    message_type_name: str = "terminate"
 
     def handle(self, server: DAPServer) -> dict[str, Any]:
         """Performs the action requested by the 'terminate' DAP request.
@@ -21,20 +21,11 @@ if TYPE_CHECKING:
 class ThreadsDAPMessage(DAPMessage):
     """Represents the 'threads' DAP request."""
 
-    message_type_name: str = "threads"
-
-    def __init__(self, message: dict[str, Any]) -> None:
-        """Initializes the 'ThreadsDAPMessage' instance.
-
-        Args:
-            message (dict[str, Any]): The object representing the 'threads' request.
-        """
-        super().__init__(message)
+    __slots__ = ()
 
-    def validate(self) -> None:
-        """Validates the 'ThreadsDAPMessage' instance."""
+    message_type_name: str = "threads"
 
-    def handle(self, server: DAPServer) -> dict[str, Any]:
+    def handle(self, _server: DAPServer) -> dict[str, Any]:
         """Performs the action requested by the 'threads' DAP request.
 
         Args:
@@ -43,6 +34,4 @@ class ThreadsDAPMessage(DAPMessage):
         Returns:
             dict[str, Any]: The response to the request.
         """
-        d = super().handle(server)
-        d["body"] = {"threads": [{"id": 1, "name": "Main Thread"}]}
-        return d
+        return self.create_response({"threads": [{"id": 1, "name": "Main Thread"}]})
@@ -10,8 +10,27 @@
 
 from __future__ import annotations
 
+from types import MappingProxyType
 from typing import Any
 
+_DEFAULT_CAPABILITIES: MappingProxyType[str, Any] = MappingProxyType({
+    "supportsConfigurationDoneRequest": True,
+    "supportsFunctionBreakpoints": False,
+    "supportsConditionalBreakpoints": False,
+    "supportsHitConditionalBreakpoints": False,
+    "supportsEvaluateForHovers": False,
+    "supportsExceptionInfoRequest": True,
+    "exceptionBreakpointFilters": (),
+    "supportsStepBack": True,
+    "supportsSetVariable": False,
+    "supportsRestartFrame": True,
+    "supportsTerminateRequest": True,
+    "supportsRestartRequest": True,
+    "supportsVariableType": True,
+    "supportsDelayedStackTraceLoading": False,
+    "supportsVariablePaging": True,
+})
+
 
 def get_default_capabilities() -> dict[str, Any]:
     """Returns the default capabilities of the DAP server.
@@ -19,20 +38,4 @@ def get_default_capabilities() -> dict[str, Any]:
     Returns:
         dict[str, Any]: The default capabilities of the DAP server.
     """
-    return {
-        "supportsConfigurationDoneRequest": True,
-        "supportsFunctionBreakpoints": False,
-        "supportsConditionalBreakpoints": False,
-        "supportsHitConditionalBreakpoints": False,
-        "supportsEvaluateForHovers": False,
-        "supportsExceptionInfoRequest": True,
-        "exceptionBreakpointFilters": [],
-        "supportsStepBack": True,
-        "supportsSetVariable": False,
-        "supportsRestartFrame": True,
-        "supportsTerminateRequest": True,
-        "supportsRestartRequest": True,
-        "supportsVariableType": True,
-        "supportsDelayedStackTraceLoading": False,
-        "supportsVariablePaging": True,
-    }
+    return dict(_DEFAULT_CAPABILITIES)
@@ -15,14 +15,19 @@ from typing import TYPE_CHECKING, Any
 from .dap_message import DAPMessage
 
 if TYPE_CHECKING:
+    from ... import Variable
     from .. import DAPServer
 
 # TODO: presentation hints for complex numbers
 
+_BOOL_NAMES = ("False", "True")
+
 
 class VariablesDAPMessage(DAPMessage):
     """Represents the 'variables' DAP request."""
 
+    __slots__ = ("count", "filter_value", "reference", "start")
+
     message_type_name: str = "variables"
 
     reference: int
@@ -42,9 +47,6 @@ class VariablesDAPMessage(DAPMessage):
         self.start = message["arguments"].get("start", 0)
         self.count = message["arguments"].get("count", 0)
 
-    def validate(self) -> None:
-        """Validates the 'VariablesDAPMessage' instance."""
-
     def handle(self, server: DAPServer) -> dict[str, Any]:
         """Performs the action requested by the 'variables' DAP request.
 
@@ -54,7 +56,6 @@ class VariablesDAPMessage(DAPMessage):
         Returns:
             dict[str, Any]: The response to the request.
         """
-        d = super().handle(server)
         variables = (
             _get_classical_variables(server, self.filter_value)
             if self.reference == 1
@@ -64,25 +65,26 @@ class VariablesDAPMessage(DAPMessage):
             if self.reference >= 10
             else []
         )
-        d["body"] = {"variables": variables}
-        return d
+        return self.create_response({"variables": variables})
 
 
 def _get_classical_children(server: DAPServer, index: int, filter_value: str) -> list[dict[str, Any]]:
     if filter_value == "named":  # all classical children are indexed
         return []
     result = []
-    num = server.simulation_state.get_num_classical_variables()
-    name = server.simulation_state.get_classical_variable_name(index).split("[")[0]
+    get_name = server.simulation_state.get_classical_variable_name
+    get_variable = server.simulation_state.get_classical_variable
+    num = server.get_num_classical_variables()
+    name = get_name(index).split("[")[0]
     for i in range(index, num):
-        n = server.simulation_state.get_classical_variable_name(i)
+        n = get_name(i)
         if n.split("[")[0] != name:
             break
-        var = server.simulation_state.get_classical_variable(n)
+        var = get_variable(n)
         result.append({
             "name": var.name,
             "evaluateName": var.name,
-            "value": str(var.value.bool_value),
+            "value": _BOOL_NAMES[var.value.bool_value],
             "type": "boolean",
             "variablesReference": 0,
         })
@@ -93,38 +95,39 @@ def _get_classical_variables(server: DAPServer, filter_value: str) -> list[dict[
     if filter_value == "indexed":  # all classical children are named
         return []
     result = []
-    num = server.simulation_state.get_num_classical_variables()
-    variable_groupings: dict[str, tuple[int, list[str]]] = {}
-    for i in range(num):
-        name = server.simulation_state.get_classical_variable_name(i)
-        if "[" not in name:
-            variable_groupings[name] = (i, [])
+    state = server.simulation_state
+    # Each entry holds the index of the first variable, the variables, and whether they form a register.
+    variable_groupings: dict[str, tuple[int, list[Variable], bool]] = {}
+    for i in range(server.get_num_classical_variables()):
+        name = state.get_classical_variable_name(i)
+        variable = state.get_classical_variable(name)
+        base, bracket, _ = name.partition("[")
+        if not bracket:
+            variable_groupings[name] = (i, [variable], False)
+        elif base not in variable_groupings:
+            variable_groupings[base] = (i, [variable], True)
         else:
-            parts = name.split("[")
-            if parts[0] not in variable_groupings:
-                variable_groupings[parts[0]] = (i, [])
-            variable_groupings[parts[0]][1].append(name)
-
-    for name, (first, indices) in variable_groupings.items():
-        if not indices:
-            var = server.simulation_state.get_classical_variable(name)
+            variable_groupings[base][1].append(variable)
+
+    for name, (first, variables, is_register) in variable_groupings.items():
+        if not is_register:
             result.append({
                 "name": name,
                 "evaluateName": name,
-                "value": str(var.value.bool_value),
+                "value": _BOOL_NAMES[variables[0].value.bool_value],
                 "type": "boolean",
                 "variablesReference": 0,
             })
         else:
-            bitstring = ""
-            for index in indices:
-                var = server.simulation_state.get_classical_variable(index)
-                bitstring = ("1" if var.value.bool_value else "0") + bitstring
-            decimal = int(bitstring, 2)
+            # The first variable of a register is its least significant bit.
+            decimal = 0
+            for k, var in enumerate(variables):
+                decimal |= var.value.bool_value << k
+            value = f"{decimal:0{len(variables)}b} ({decimal})"
             result.append({
                 "name": name,
-                "value": f"{bitstring} ({decimal})",
-                "evaluateName": f"{bitstring} ({decimal})",
+                "value": value,
+                "evaluateName": value,
                 "type": "integer",
                 "variablesReference": 10 + first,
                 # Compound registers have reference 10 + the index of their first variable
@@ -136,7 +139,8 @@ def _get_classical_variables(server: DAPServer, filter_value: str) -> list[dict[
 def _get_quantum_state_variables(server: DAPServer, start: int, count: int, filter_value: str) -> list[dict[str, Any]]:
     if filter_value == "indexed":  # all quantum states are named
         return []
-    if server.simulation_state.get_num_qubits() > 8 and count == 0:
+    num_q = server.get_num_qubits()
+    if num_q > 8 and count == 0:
         return [
             {
                 "name": "",
@@ -146,16 +150,22 @@ def _get_quantum_state_variables(server: DAPServer, start: int, count: int, filt
             }
         ]
     result = []
-    num_q = server.simulation_state.get_num_qubits()
-    start = 0
-    count = 10
-    num_variables = 2**num_q if count == 0 else count
-    for i in range(start, start + num_variables):
-        bitstring = format(i, f"0{num_q}b")
+    state = server.simulation_state
+    num_states = 1 << num_q
+    # A count of 0 requests all states, which the guard above bounds to 2^8 entries.
+    end = num_states if count == 0 else min(start + count, num_states)
+    if start == 0 and end == num_states:
+        # Fetch the whole state at once instead of one amplitude per call.
+        amplitudes = state.get_state_vector_full().amplitudes
+    else:
+        amplitudes = [state.get_amplitude_index(i) for i in range(start, end)]
+    spec = f"0{num_q}b"
+    for i, amplitude in enumerate(amplitudes, start):
+        name = f"|{i:{spec}}>"
         result.append({
-            "name": f"|{bitstring}>",
-            "evaluateName": f"|{bitstring}>",
-            "value": str(server.simulation_state.get_amplitude_bitstring(bitstring)),
+            "name": name,
+            "evaluateName": name,
+            "value": str(amplitude),
             "type": "complex",
             "variablesReference": 0,
         })
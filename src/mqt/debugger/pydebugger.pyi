@@ -251,6 +251,16 @@ class SimulationState:
             tuple[int, int]: The start and end positions of the instruction.
         """
 
+    def get_instruction_positions(self) -> list[tuple[int, int]]:
+        """Gets the positions of all instructions in the code.
+
+        This is equivalent to calling `get_instruction_position` for each instruction,
+        but only crosses the language boundary once.
+
+        Returns:
+            list[tuple[int, int]]: The start and end positions of each instruction.
+        """
+
     def get_num_qubits(self) -> int:
         """Gets the number of qubits used by the program.
 
@@ -384,6 +394,19 @@ class SimulationState:
             list[int]: The stack trace of the simulation.
         """
 
+    def get_stack_trace_positions(self, max_depth: int) -> list[tuple[int, int]]:
+        """Gets the code positions of all instructions in the current stack trace.
+
+        This is equivalent to calling `get_instruction_position` for each entry of
+        `get_stack_trace`, but only crosses the language boundary once.
+
+        Args:
+            max_depth (int): The maximum depth of the stack trace.
+
+        Returns:
+            list[tuple[int, int]]: The start and end positions of each stack entry.
+        """
+
     def get_diagnostics(self) -> Diagnostics:
         """Gets the diagnostics instance employed by this debugger.
 
@@ -340,6 +340,24 @@ Args:
 
 Returns:
     tuple[int, int]: The start and end positions of the instruction.)")
+      .def(
+          "get_instruction_positions",
+          [](SimulationState* self) {
+            const size_t count = self->getInstructionCount(self);
+            std::vector<std::pair<size_t, size_t>> positions(count);
+            for (size_t i = 0; i < count; i++) {
+              checkOrThrow(self->getInstructionPosition(
+                  self, i, &positions[i].first, &positions[i].second));
+            }
+            return positions;
+          },
+          R"(Gets the positions of all instructions in the code.
+
+This is equivalent to calling `get_instruction_position` for each instruction,
+but only crosses the language boundary once.
+
+Returns:
+    list[tuple[int, int]]: The start and end positions of each instruction.)")
       .def(
           "get_num_qubits",
           [](SimulationState* self) { return self->getNumQubits(self); },
@@ -556,6 +574,33 @@ Args:
 
 Returns:
     list[int]: The stack trace of the simulation.)")
+      .def(
+          "get_stack_trace_positions",
+          [](SimulationState* self, size_t maxDepth) {
+            size_t trueSize = 0;
+            checkOrThrow(self->getStackDepth(self, &trueSize));
+            const size_t stackSize = std::min(maxDepth, trueSize);
+            std::vector<size_t> stackTrace(stackSize);
+            checkOrThrow(
+                self->getStackTrace(self, maxDepth, stackTrace.data()));
+            std::vector<std::pair<size_t, size_t>> positions(stackSize);
+            for (size_t i = 0; i < stackSize; i++) {
+              checkOrThrow(self->getInstructionPosition(
+                  self, stackTrace[i], &positions[i].first,
+                  &positions[i].second));
+            }
+            return positions;
+          },
+          R"(Gets the code positions of all instructions in the current stack trace.
+
+This is equivalent to calling `get_instruction_position` for each entry of
+`get_stack_trace`, but only crosses the language boundary once.
+
+Args:
+    max_depth (int): The maximum depth of the stack trace.
+
+Returns:
+    list[tuple[int, int]]: The start and end positions of each stack entry.)")
       .def(
           "get_diagnostics",
           [](SimulationState* self) { return self->getDiagnostics(self); },
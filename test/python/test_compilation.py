@@ -10,6 +10,7 @@
 
 from __future__ import annotations
 
+import argparse
 import json
 import locale
 import os
@@ -442,6 +443,86 @@ def test_main_shots(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixtu
     assert shots == 180, f"Expected 100 shots, but got {shots}."
 
 
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["prepare", "program.qasm"],
+        ["prepare", "program.qasm", "--output-dir", "out"],
+        ["--calibration", "calibration.json", "check", "results.json", "-d", "compiled", "-s", "2", "-p", "0.01"],
+        ["check", "--slice", "3", "results.json"],
+        ["shots", "slice_1.qasm", "--trials", "50", "--accuracy", "0.9", "-p", "0.1"],
+    ],
+)
+def test_fast_parse_args_matches_parser(argv: list[str]) -> None:
+    """Test that the fast path for parsing command line arguments agrees with the argument parser.
+
+    Args:
+        argv (list[str]): The command line arguments to parse.
+    """
+    assert runtime_check._fast_parse_args(argv) == runtime_check._build_parser().parse_args(argv)  # noqa: SLF001
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["--help"],
+        ["check", "--help"],
+        ["prepare"],
+        ["prepare", "a.qasm", "b.qasm"],
+        ["prepare", "a.qasm", "-o"],
+        ["prepare", "a.qasm", "-oout"],
+        ["check", "results.json", "--slice", "one"],
+        ["shots", "slice_1.qasm", "-p", "-0.1"],
+        ["shots", "slice_1.qasm", "--calibration", "calibration.json"],
+    ],
+)
+def test_fast_parse_args_falls_back(argv: list[str]) -> None:
+    """Test that the fast path for parsing command line arguments defers unusual arguments to the argument parser.
+
+    Args:
+        argv (list[str]): The command line arguments to parse.
+    """
+    assert runtime_check._fast_parse_args(argv) is None  # noqa: SLF001
+
+
+def test_fast_path_modes_match_parser() -> None:
+    """Test that the modes known to the fast path for parsing command line arguments mirror the argument parser."""
+    parser = runtime_check._build_parser()  # noqa: SLF001
+    subparsers = next(action for action in parser._actions if isinstance(action, argparse._SubParsersAction))  # noqa: SLF001
+    assert set(subparsers.choices) == set(runtime_check._FAST_PATH_MODES)  # noqa: SLF001
+    for mode, subparser in subparsers.choices.items():
+        positional, options, defaults = runtime_check._FAST_PATH_MODES[mode]  # noqa: SLF001
+        actions = [action for action in subparser._actions if not isinstance(action, argparse._HelpAction)]  # noqa: SLF001
+        assert [action.dest for action in actions if not action.option_strings] == [positional]
+        parser_options = {}
+        parser_defaults = {}
+        for action in actions:
+            if not action.option_strings:
+                continue
+            for option in action.option_strings:
+                parser_options[option] = (action.dest, action.type)
+            # The argument parser converts string defaults with the type of the argument.
+            default = action.default
+            if isinstance(default, str) and callable(action.type):
+                default = action.type(default)
+            parser_defaults[action.dest] = default
+        assert parser_options == options
+        assert parser_defaults == defaults
+
+
+def test_result_load_repeated_distribution(tmp_path: Path) -> None:
+    """Test that loading results counts a distribution that is listed more than once only once.
+
+    Args:
+        tmp_path (Path): A temporary directory for the results file.
+    """
+    results = tmp_path / "results.json"
+    results.write_text(json.dumps([{"a": 1, "b": 0}, {"a": 1, "b": 1}, {"a": 0, "b": 0}]), encoding="utf-8")
+    result = result_checker.Result.load(results, [("a", "b"), ("a", "b")])
+    assert result.num_samples == 3
+    assert result.distribution == {("a", "b"): [1, 1, 0, 1]}
+
+
 def test_contribution_equal_under_noise_big_difference() -> None:
     """Test the correctness of the `distribution_equal_under_noise` function when distributions are very different."""
     assert not result_checker.distribution_equal_under_noise(
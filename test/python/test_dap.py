@@ -0,0 +1,144 @@
+# Copyright (c) 2024 - 2025 Chair for Design Automation, TUM
+# Copyright (c) 2025 Munich Quantum Software Company GmbH
+# All rights reserved.
+#
+# SPDX-License-Identifier: MIT
+#
+# Licensed under the MIT License
+
+"""Tests the DAP server of the debugger."""
+
+from __future__ import annotations
+
+import json
+import socket
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from mqt.debugger import create_ddsim_simulation_state, destroy_ddsim_simulation_state
+from mqt.debugger.dap import DAPServer
+from mqt.debugger.dap.dap_server import MessageReader
+from mqt.debugger.dap.messages import variables_dap_message
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+
+def frame(payload: dict[str, Any]) -> tuple[bytes, bytearray]:
+    """Encode a message according to the DAP messaging protocol.
+
+    Args:
+        payload (dict[str, Any]): The JSON content of the message.
+
+    Returns:
+        tuple[bytes, bytearray]: The header and the content of the message.
+    """
+    content = bytearray(json.dumps(payload).encode())
+    return f"Content-Length: {len(content)}\r\n\r\n".encode(), content
+
+
+def test_message_reader_split_across_receives() -> None:
+    """Test reading a message whose header and content arrive in several parts."""
+    header, content = frame({"seq": 1, "command": "initialize"})
+    client, server = socket.socketpair()
+    with client, server:
+        reader = MessageReader(server, chunk_size=8)
+        client.sendall(header[:5])
+        client.sendall(header[5:] + content[:3])
+        client.sendall(content[3:])
+        client.shutdown(socket.SHUT_WR)
+        assert reader.read() == content
+        assert reader.read() is None
+
+
+def test_message_reader_multiple_messages_in_one_chunk() -> None:
+    """Test reading two messages that arrive together."""
+    first_header, first = frame({"seq": 1, "command": "initialize"})
+    second_header, second = frame({"seq": 2, "command": "launch"})
+    client, server = socket.socketpair()
+    with client, server:
+        reader = MessageReader(server)
+        client.sendall(first_header + first + second_header + second)
+        client.shutdown(socket.SHUT_WR)
+        assert reader.read() == first
+        assert reader.read() == second
+        assert reader.read() is None
+
+
+def test_message_reader_large_message() -> None:
+    """Test reading a message that is larger than a single chunk."""
+    header, content = frame({"seq": 1, "command": "launch", "arguments": {"program": "x" * 100000}})
+    assert len(content) > 65536
+    client, server = socket.socketpair()
+    with client, server:
+        reader = MessageReader(server)
+        client.sendall(header + content)
+        client.shutdown(socket.SHUT_WR)
+        assert reader.read() == content
+
+
+def test_message_reader_missing_content_length() -> None:
+    """Test that a message without a Content-Length header is rejected."""
+    client, server = socket.socketpair()
+    with client, server:
+        reader = MessageReader(server)
+        client.sendall(b"Content-Type: application/json\r\n\r\n{}")
+        with pytest.raises(RuntimeError, match="Content-Length"):
+            reader.read()
+
+
+def test_code_coordinates_to_pos() -> None:
+    """Test converting code coordinates to positions, including the line just past the end of the code."""
+    server = DAPServer()
+    server.source_code = "qreg q[2];\nh q[0];\n"
+    assert server.code_coordinates_to_pos(1, 1) == 0
+    assert server.code_coordinates_to_pos(2, 3) == 13
+    assert server.code_coordinates_to_pos(3, 1) == 19
+    assert server.code_coordinates_to_pos(4, 2) == 21
+
+
+@pytest.fixture
+def ghz_server() -> Generator[DAPServer, None, None]:
+    """Fixture for a DAP server that ran a three-qubit GHZ preparation."""
+    server = DAPServer()
+    server.source_code = "qreg q[3];\nh q[0];\ncx q[0], q[1];\ncx q[1], q[2];\n"
+    server.simulation_state = create_ddsim_simulation_state()
+    server.simulation_state.load_code(server.source_code)
+    server.simulation_state.run_simulation()
+    yield server
+    destroy_ddsim_simulation_state(server.simulation_state)
+
+
+def state_names(variables: list[dict[str, Any]]) -> list[str]:
+    """Get the names of quantum state variables.
+
+    Args:
+        variables (list[dict[str, Any]]): The quantum state variables.
+
+    Returns:
+        list[str]: The names of the variables.
+    """
+    return [variable["name"] for variable in variables]
+
+
+def test_quantum_state_variables_all(ghz_server: DAPServer) -> None:
+    """Test that a count of 0 requests all quantum states."""
+    variables = variables_dap_message._get_quantum_state_variables(ghz_server, 0, 0, "")  # noqa: SLF001
+    assert state_names(variables) == [f"|{i:03b}>" for i in range(8)]
+    state = ghz_server.simulation_state
+    assert [variable["value"] for variable in variables] == [str(state.get_amplitude_index(i)) for i in range(8)]
+
+
+def test_quantum_state_variables_page(ghz_server: DAPServer) -> None:
+    """Test requesting a page of the quantum states."""
+    variables = variables_dap_message._get_quantum_state_variables(ghz_server, 2, 3, "")  # noqa: SLF001
+    assert state_names(variables) == ["|010>", "|011>", "|100>"]
+    state = ghz_server.simulation_state
+    assert [variable["value"] for variable in variables] == [str(state.get_amplitude_index(i)) for i in range(2, 5)]
+
+
+def test_quantum_state_variables_page_clamped(ghz_server: DAPServer) -> None:
+    """Test that a page reaching past the last quantum state is clamped."""
+    variables = variables_dap_message._get_quantum_state_variables(ghz_server, 6, 5, "")  # noqa: SLF001
+    assert state_names(variables) == ["|110>", "|111>"]
@@ -125,6 +125,10 @@ def test_step_out(simulation_instance_jumps: SimulationInstance) -> None:
     assert simulation_state.get_current_instruction() == 12
     assert simulation_state.get_stack_depth() == 2
     assert simulation_state.get_stack_trace(2) == [12, 20]
+    assert simulation_state.get_stack_trace_positions(2) == [
+        simulation_state.get_instruction_position(12),
+        simulation_state.get_instruction_position(20),
+    ]
     simulation_state.step_out_backward()
     assert simulation_state.get_current_instruction() == 20
     assert simulation_state.get_stack_depth() == 1
@@ -172,11 +176,16 @@ def test_instruction_count(simulation_instance: str, request: pytest.FixtureRequ
 
 
 def test_instruction_positions(simulation_instance_jumps: SimulationInstance) -> None:
-    """Tests the `get_instruction_position(instruction)` method."""
+    """Tests the `get_instruction_position(instruction)` and `get_instruction_positions()` methods."""
     (simulation_state, _state_id) = simulation_instance_jumps
     assert simulation_state.get_instruction_position(0) == (0, 9)
     assert simulation_state.get_instruction_position(1) == (12, 47)
     assert simulation_state.get_instruction_position(16) == (241, 254)
+    positions = simulation_state.get_instruction_positions()
+    assert len(positions) == simulation_state.get_instruction_count()
+    assert positions[0] == (0, 9)
+    assert positions[1] == (12, 47)
+    assert positions[16] == (241, 254)
 
 
 @pytest.mark.parametrize(